@@ -1,8 +1,9 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from enum import Enum
 
-app = FastAPI(title="BRICS Off-chain Engine")
+app = FastAPI(title="BRICS Off-chain Engine", default_response_class=ORJSONResponse)
 
 class EmergencyLevel(int, Enum):
     NORMAL=0; YELLOW=1; ORANGE=2; RED=3
@@ -1,9 +1,25 @@
 #!/usr/bin/env python3
 import sys
 import re
-import yaml
 from pathlib import Path
 
+# Checkout step not already followed by a `with:` line (single-line, multiline mode)
+CHECKOUT_PATTERN = re.compile(
+    r'^(?P<indent>[ \t]*)-[ \t]*uses:[ \t]*actions/checkout@v4[ \t\r]*$(?!\n[^\n]*with:)',
+    re.M,
+)
+
+def _checkout_with_block(match):
+    """Append the submodule-safety `with:` block to a matched checkout step."""
+    indent_str = ' ' * (len(match.group('indent')) + 2)
+    return '\n'.join([
+        match.group(0),
+        f"{indent_str}with:",
+        f"{indent_str}  fetch-depth: 0",
+        f"{indent_str}  submodules: false",
+        f"{indent_str}  persist-credentials: false"
+    ])
+
 def patch_workflow_file(filepath):
     """Patch a workflow file to add submodule safety to all checkout actions."""
     print(f"Patching {filepath}")
@@ -11,50 +27,26 @@ def patch_workflow_file(filepath):
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    # Find all checkout actions and add safety parameters
-    # Pattern: - uses: actions/checkout@v4
-    # We need to add with: block after each one
-    
-    lines = content.split('\n')
-    new_lines = []
-    i = 0
-    
-    while i < len(lines):
-        line = lines[i]
-        new_lines.append(line)
-        
-        # Check if this is a checkout action
-        if re.match(r'^\s*-\s*uses:\s*actions/checkout@v4\s*$', line):
-            # Check if next line already has 'with:'
-            if i + 1 < len(lines) and 'with:' in lines[i + 1]:
-                # Already has with block, skip
-                i += 1
-                continue
-            
-            # Add with block
-            indent = len(line) - len(line.lstrip())
-            indent_str = ' ' * (indent + 2)
-            new_lines.extend([
-                f"{indent_str}with:",
-                f"{indent_str}  fetch-depth: 0",
-                f"{indent_str}  submodules: false",
-                f"{indent_str}  persist-credentials: false"
-            ])
-        
-        i += 1
+    # Add a with: block after each `- uses: actions/checkout@v4` in one regex pass;
+    # the negative lookahead skips steps that already have one
+    content, count = CHECKOUT_PATTERN.subn(_checkout_with_block, content)
+    if not count:
+        print(f"  ✓ Already patched")
+        return
     
     # Write back
     with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(new_lines))
+        f.write(content)
     
     print(f"  ✓ Patched checkout actions")
 
 def main():
     workflow_dir = Path('.github/workflows')
     
-    for yml_file in workflow_dir.glob('*.yml'):
-        if yml_file.is_file():
-            patch_workflow_file(yml_file)
+    workflow_files = [p for p in workflow_dir.glob('*.yml') if p.is_file()]
+    
+    for yml_file in workflow_files:
+        patch_workflow_file(yml_file)
 
 if __name__ == '__main__':
     main()
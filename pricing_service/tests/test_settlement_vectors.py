@@ -2,11 +2,21 @@ import json
 from pathlib import Path
 import math
 
+import numpy as np
+import pytest
+
+try:
+    import numba
+except ImportError:  # numba is optional; the pure-Python kernel is used instead
+    numba = None
+
+# Largest |numer| the int64 kernel handles without overflow (numer + denom//2 must fit)
+INT64_SAFE_NUMER = 2**62
+
 def round_half_up(numer, denom):
-    if numer >= 0:
-        return (numer + denom // 2) // denom
-    else:
-        return -(((-numer) + denom // 2) // denom)
+    # Branchless: round the magnitude half-up, then reapply the sign (denom > 0)
+    sign = 1 - 2 * (numer < 0)
+    return sign * ((sign * numer + denom // 2) // denom)
 
 def compute_pnl_smallest(fair_bps, fixed_bps, notional, elapsed_days, tenor_days):
     delta_bps = fair_bps - fixed_bps
@@ -14,13 +24,85 @@ def compute_pnl_smallest(fair_bps, fixed_bps, notional, elapsed_days, tenor_days
     denom = 10000 * tenor_days
     return round_half_up(numer, denom)
 
+if numba is not None:
+    # Eagerly compiled int64 kernels (explicit signatures skip dispatch/type inference)
+    round_half_up_i64 = numba.njit("int64(int64, int64)", cache=True)(round_half_up)
+
+    @numba.njit("int64(int64, int64, int64, int64, int64)", cache=True)
+    def compute_pnl_smallest_i64(fair_bps, fixed_bps, notional, elapsed_days, tenor_days):
+        delta_bps = fair_bps - fixed_bps
+        numer = delta_bps * notional * elapsed_days
+        denom = 10000 * tenor_days
+        return round_half_up_i64(numer, denom)
+
+def compute_pnl_smallest_fast(fair_bps, fixed_bps, notional, elapsed_days, tenor_days):
+    # JIT path only when the numerator provably fits int64; otherwise Python ints
+    if numba is not None and abs((fair_bps - fixed_bps) * notional * elapsed_days) < INT64_SAFE_NUMER:
+        return compute_pnl_smallest_i64(fair_bps, fixed_bps, notional, elapsed_days, tenor_days)
+    return compute_pnl_smallest(fair_bps, fixed_bps, notional, elapsed_days, tenor_days)
+
+def compute_pnl_smallest_vec(fair_bps, fixed_bps, notional, elapsed_days, tenor_days):
+    # Same math as compute_pnl_smallest over whole columns; falls back to object
+    # arrays (Python ints) when the numerator could overflow int64
+    delta_bps = np.asarray(fair_bps, dtype=object) - np.asarray(fixed_bps, dtype=object)
+    bound = 1
+    for column in (delta_bps, notional, elapsed_days):
+        bound *= max(abs(int(x)) for x in column)
+    dtype = np.int64 if bound < INT64_SAFE_NUMER else object
+    delta_bps = delta_bps.astype(dtype)
+    numer = delta_bps * np.asarray(notional, dtype=dtype) * np.asarray(elapsed_days, dtype=dtype)
+    denom = 10000 * np.asarray(tenor_days, dtype=dtype)
+    return np.sign(numer) * ((np.abs(numer) + denom // 2) // denom)
+
+def load_vectors():
+    return json.loads(Path("tests/golden/settlement_vectors.json").read_text())
+
 def test_golden_vectors_parity():
-    vectors = json.loads(Path("tests/golden/settlement_vectors.json").read_text())
-    for v in vectors:
-        got = compute_pnl_smallest(
-            v["fairSpreadBps"], v["fixedSpreadBps"], v["notional"], v["elapsedDays"], v["tenorDays"]
-        )
-        assert got == v["expectedPnlSmallest"], f"{v['name']}: got {got}, expected {v['expectedPnlSmallest']}"
+    vectors = load_vectors()
+    got = compute_pnl_smallest_vec(
+        [v["fairSpreadBps"] for v in vectors],
+        [v["fixedSpreadBps"] for v in vectors],
+        [v["notional"] for v in vectors],
+        [v["elapsedDays"] for v in vectors],
+        [v["tenorDays"] for v in vectors],
+    )
+    expected = np.array([v["expectedPnlSmallest"] for v in vectors], dtype=got.dtype)
+    if not np.array_equal(got, expected):
+        # Re-run the mismatching rows through the scalar reference path
+        for i in np.flatnonzero(got != expected):
+            v = vectors[i]
+            ref = compute_pnl_smallest(
+                v["fairSpreadBps"], v["fixedSpreadBps"], v["notional"], v["elapsedDays"], v["tenorDays"]
+            )
+            assert got[i] == v["expectedPnlSmallest"], f"{v['name']}: got {got[i]} (scalar {ref}), expected {v['expectedPnlSmallest']}"
+
+def test_fast_kernel_matches_scalar():
+    for v in load_vectors():
+        args = (v["fairSpreadBps"], v["fixedSpreadBps"], v["notional"], v["elapsedDays"], v["tenorDays"])
+        assert compute_pnl_smallest_fast(*args) == compute_pnl_smallest(*args), v["name"]
+    # Overflowing numerator must take the Python-int path
+    for big in ((10**6, 0, 10**9, 10**6, 365), (10**6, 0, -(10**9), 10**6, 365), (0, 10**6, 10**9, -(10**6), 365)):
+        assert compute_pnl_smallest_fast(*big) == compute_pnl_smallest(*big)
+
+def test_jit_kernel_matches_scalar():
+    pytest.importorskip("numba")
+    for v in load_vectors():
+        args = (v["fairSpreadBps"], v["fixedSpreadBps"], v["notional"], v["elapsedDays"], v["tenorDays"])
+        assert compute_pnl_smallest_i64(*args) == compute_pnl_smallest(*args), v["name"]
+    # Negative deltas and half-way cases exercise the branchless sign handling
+    for args in ((0, 25, 10**6, 1, 2), (25, 0, 10**6, 1, 2), (0, 1, 1, 1, 1), (-7, 3, -(10**9), 90, 365)):
+        assert compute_pnl_smallest_i64(*args) == compute_pnl_smallest(*args), args
+
+def test_vectorized_matches_scalar_on_overflow_path():
+    args = ([10**6, -(10**6)], [0, 0], [10**9, 10**9], [10**6, 3], [365, 7])
+    got = compute_pnl_smallest_vec(*args)
+    assert got.dtype == object
+    assert list(got) == [compute_pnl_smallest(*row) for row in zip(*args)]
+    # Negative notionals overflow too, so the bound must use magnitudes
+    args = ([10**6], [0], [-(10**9)], [10**6], [365])
+    got = compute_pnl_smallest_vec(*args)
+    assert got.dtype == object
+    assert list(got) == [compute_pnl_smallest(*row) for row in zip(*args)] == [-273972602739726]
 
 if __name__ == "__main__":
     test_golden_vectors_parity()
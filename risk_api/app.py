@@ -5,22 +5,24 @@ Provides aggregate-only risk feeds with deterministic Ed25519 signing
 for data integrity and authenticity verification.
 """
 
+import asyncio
 import os
-import time
-from typing import Dict, Any
-
-from fastapi import Depends, FastAPI, HTTPException
-from fastapi.responses import JSONResponse
-
-from .deps import (
-    get_signing_key,
-    get_nav_provider,
-    get_emergency_provider,
-    get_issuance_provider,
-    get_risk_provider,
-    get_safety_provider,
-)
-from .signing import SigningKey
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Dict, Any, Optional, Tuple, Type
+
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .clock import now_s, run_ticker
+from . import state
+from .responses import RiskJSONResponse, render_json
+from .providers import EmergencyData, IssuanceData, NavData, RiskData
+from .signing import canonical_from_template, canonical_with_ts
+from .store import FeedSnapshot
 from .models import (
     HealthResponse,
     PublicKeyResponse,
@@ -30,8 +32,267 @@ from .models import (
     RiskSummaryResponse,
     LanePretradeResponse,
     NavSanityResponse,
+    SnapshotResponse,
 )
 
+# Responses smaller than this (bytes) are sent uncompressed
+GZIP_MINIMUM_SIZE = int(os.getenv("RISK_API_GZIP_MINIMUM_SIZE", "256"))
+
+# Seconds between background feed snapshot refreshes (keeps snapshot
+# timestamps within a second of the current time)
+SNAPSHOT_REFRESH_INTERVAL_S = 0.5
+
+# Signed response dicts kept per feed. Snapshots are immutable, so each one is
+# signed and laid out once and the (read-only) dict is shared by every request
+SIGNED_PAYLOAD_CACHE_SIZE = 4
+
+# Signed safety check results kept, keyed by query inputs and second; repeat
+# checks within a second reuse the whole signed body (read-only, like above)
+SAFETY_RESPONSE_CACHE_SIZE = 256
+
+# Seconds between events on the NDJSON snapshot stream
+STREAM_INTERVAL_S = float(os.getenv("RISK_API_STREAM_INTERVAL_S", "1.0"))
+
+# Longest a safety check waits for concurrent checks to join its signing batch
+SIGN_BATCH_MAX_DELAY_S = 0.0005
+
+
+def _presign_snapshot(snapshot: FeedSnapshot) -> None:
+    """Warm the signature cache for every feed in a snapshot.
+    
+    Runs in the refresher's worker thread, so libsodium signing (which releases
+    the GIL) happens off the event loop and request handlers hit the cache.
+    """
+    signing_key = state.get_signing_key()
+    for data in (snapshot.nav, snapshot.emergency, snapshot.issuance, snapshot.risk):
+        signing_key.sign_bytes(canonical_with_ts(data.canon_prefix, data.ts))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Application lifespan: start the clock ticker, feed snapshot refresher
+    and batch signer.
+    
+    Snapshots are presigned by the refresher when a signing key is configured.
+    Batched safety check signing is opt-in via RISK_API_SIGN_BATCH_SIZE because
+    each batch waits up to SIGN_BATCH_MAX_DELAY_S for concurrent requests.
+    """
+    ticker_task = asyncio.create_task(run_ticker())
+    
+    # Presign snapshots in the refresher thread when a signing key is configured
+    try:
+        state.get_signing_key()
+        prepare = _presign_snapshot
+    except ValueError:
+        prepare = None
+    refresher_task = asyncio.create_task(
+        state.SNAPSHOT_STORE.run_refresher(SNAPSHOT_REFRESH_INTERVAL_S, prepare)
+    )
+    
+    sign_batch_size = int(os.getenv("RISK_API_SIGN_BATCH_SIZE", "0"))
+    batch_task = None
+    if sign_batch_size > 0:
+        state.get_signing_key()
+        batch_task = asyncio.create_task(
+            state.BATCH_SIGNER.run(sign_batch_size, SIGN_BATCH_MAX_DELAY_S)
+        )
+    
+    yield
+    
+    if batch_task is not None:
+        batch_task.cancel()
+    refresher_task.cancel()
+    ticker_task.cancel()
+
+
+def _trusted_fields(model: Type[BaseModel], **fields: Any) -> Dict[str, Any]:
+    """Dump trusted handler data through a response model without validation."""
+    return model.model_construct(**fields).model_dump()
+
+
+def _trusted_response(model: Type[BaseModel], **fields: Any) -> RiskJSONResponse:
+    """Build a response from trusted handler data without response-model validation.
+    
+    Routes declare their models via ``responses`` for OpenAPI only, so FastAPI
+    skips its second validation pass over data the handler already built.
+    """
+    return RiskJSONResponse(_trusted_fields(model, **fields))
+
+
+@lru_cache(maxsize=SIGNED_PAYLOAD_CACHE_SIZE)
+def _signed_nav_latest(nav_data: NavData) -> Dict[str, Any]:
+    """Sign NAV data from a feed snapshot."""
+    signature = state.get_signing_key().sign_bytes(
+        canonical_with_ts(nav_data.canon_prefix, nav_data.ts)
+    )
+    return _trusted_fields(
+        NavLatestResponse,
+        nav_ray=nav_data.nav_ray,
+        model_hash=nav_data.model_hash,
+        emergency_nav_ray=nav_data.emergency_nav_ray,
+        emergency_enabled=nav_data.emergency_enabled,
+        ts=nav_data.ts,
+        sig=signature,
+    )
+
+
+@lru_cache(maxsize=SIGNED_PAYLOAD_CACHE_SIZE)
+def _signed_emergency_level(emergency_data: EmergencyData) -> Dict[str, Any]:
+    """Sign emergency state from a feed snapshot."""
+    signature = state.get_signing_key().sign_bytes(
+        canonical_with_ts(emergency_data.canon_prefix, emergency_data.ts)
+    )
+    return _trusted_fields(
+        EmergencyLevelResponse,
+        level=emergency_data.level,
+        reason=emergency_data.reason,
+        ts=emergency_data.ts,
+        sig=signature,
+    )
+
+
+@lru_cache(maxsize=SIGNED_PAYLOAD_CACHE_SIZE)
+def _signed_issuance_state(issuance_data: IssuanceData) -> Dict[str, Any]:
+    """Sign issuance controller state from a feed snapshot."""
+    signature = state.get_signing_key().sign_bytes(
+        canonical_with_ts(issuance_data.canon_prefix, issuance_data.ts)
+    )
+    return _trusted_fields(
+        IssuanceStateResponse,
+        locked=issuance_data.locked,
+        cap_tokens=issuance_data.cap_tokens,
+        detach_bps=issuance_data.detach_bps,
+        ratify_until=issuance_data.ratify_until,
+        ts=issuance_data.ts,
+        sig=signature,
+    )
+
+
+@lru_cache(maxsize=SIGNED_PAYLOAD_CACHE_SIZE)
+def _signed_risk_summary(risk_data: RiskData) -> Dict[str, Any]:
+    """Sign risk metrics from a feed snapshot."""
+    signature = state.get_signing_key().sign_bytes(
+        canonical_with_ts(risk_data.canon_prefix, risk_data.ts)
+    )
+    return _trusted_fields(
+        RiskSummaryResponse,
+        defaults_bps=risk_data.defaults_bps,
+        sovereign_usage_bps=risk_data.sovereign_usage_bps,
+        correlation_bps=risk_data.correlation_bps,
+        ts=risk_data.ts,
+        sig=signature,
+    )
+
+
+@lru_cache(maxsize=SAFETY_RESPONSE_CACHE_SIZE)
+def _lane_pretrade_fields(price_bps: int, emergency_level: int, ts: int) -> Tuple[Dict[str, Any], bytes]:
+    """Lane pre-trade check result (with an empty ``sig``) and its canonical bytes."""
+    pretrade_data = state.SAFETY_PROVIDER.get_lane_pretrade_data(price_bps, emergency_level)
+    pretrade_data["ts"] = ts
+    fields = _trusted_fields(
+        LanePretradeResponse,
+        ok=pretrade_data["ok"],
+        min_bps=pretrade_data["min_bps"],
+        max_bps=pretrade_data["max_bps"],
+        price_bps=pretrade_data["price_bps"],
+        emergency_level=pretrade_data["emergency_level"],
+        ts=ts,
+        sig="",
+    )
+    return fields, canonical_from_template(LanePretradeResponse.CANON_TEMPLATE, pretrade_data)
+
+
+@lru_cache(maxsize=SAFETY_RESPONSE_CACHE_SIZE)
+def _signed_lane_pretrade(price_bps: int, emergency_level: int, ts: int) -> Dict[str, Any]:
+    """Lane pre-trade check result with its Ed25519 signature."""
+    fields, canonical = _lane_pretrade_fields(price_bps, emergency_level, ts)
+    return {**fields, "sig": state.get_signing_key().sign_bytes(canonical)}
+
+
+@lru_cache(maxsize=SAFETY_RESPONSE_CACHE_SIZE)
+def _nav_sanity_fields(
+    proposed_nav_ray: int,
+    max_jump_bps: int,
+    emergency_enabled: int,
+    prev_nav_ray: Optional[int],
+    ts: int,
+) -> Tuple[Dict[str, Any], bytes]:
+    """NAV sanity check result (with an empty ``sig``) and its canonical bytes."""
+    nav_sanity_data = state.SAFETY_PROVIDER.get_nav_sanity_data(
+        proposed_nav_ray=proposed_nav_ray,
+        max_jump_bps=max_jump_bps,
+        emergency_enabled=emergency_enabled,
+        prev_nav_ray=prev_nav_ray,
+    )
+    nav_sanity_data["ts"] = ts
+    fields = _trusted_fields(
+        NavSanityResponse,
+        ok=nav_sanity_data["ok"],
+        prev_nav_ray=nav_sanity_data["prev_nav_ray"],
+        proposed_nav_ray=nav_sanity_data["proposed_nav_ray"],
+        max_jump_bps=nav_sanity_data["max_jump_bps"],
+        emergency_enabled=nav_sanity_data["emergency_enabled"],
+        assumed_prev=nav_sanity_data["assumed_prev"],
+        ts=ts,
+        sig="",
+    )
+    return fields, canonical_from_template(NavSanityResponse.CANON_TEMPLATE, nav_sanity_data)
+
+
+@lru_cache(maxsize=SAFETY_RESPONSE_CACHE_SIZE)
+def _signed_nav_sanity(
+    proposed_nav_ray: int,
+    max_jump_bps: int,
+    emergency_enabled: int,
+    prev_nav_ray: Optional[int],
+    ts: int,
+) -> Dict[str, Any]:
+    """NAV sanity check result with its Ed25519 signature."""
+    fields, canonical = _nav_sanity_fields(proposed_nav_ray, max_jump_bps, emergency_enabled, prev_nav_ray, ts)
+    return {**fields, "sig": state.get_signing_key().sign_bytes(canonical)}
+
+
+async def _signed_safety_check(
+    fields_builder: Callable[..., Tuple[Dict[str, Any], bytes]],
+    signed_builder: Callable[..., Dict[str, Any]],
+    *args: Any,
+) -> Dict[str, Any]:
+    """Signed safety check result, signed through the batch signer when it runs.
+    
+    Without the batch signer the cached inline-signed result is used as before.
+    """
+    if not state.BATCH_SIGNER.running:
+        return signed_builder(*args)
+    fields, canonical = fields_builder(*args)
+    return {**fields, "sig": await state.BATCH_SIGNER.sign(canonical)}
+
+
+@lru_cache(maxsize=4 * SIGNED_PAYLOAD_CACHE_SIZE)
+def _signed_body(builder: Callable[[Any], Dict[str, Any]], data: Any) -> bytes:
+    """Encoded JSON body of a ``_signed_*`` payload, rendered once per snapshot."""
+    return render_json(builder(data))
+
+
+class StreamingSafeGZipMiddleware:
+    """GZipMiddleware that leaves streaming routes uncompressed.
+    
+    Starlette's GZipResponder never flushes its compressor per chunk, so a
+    gzip-accepting client of a streamed response would receive nothing until
+    the stream closes (and nothing at all from an unbounded stream).
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: Tuple[str, ...], **gzip_options: Any) -> None:
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+        self.gzip = GZipMiddleware(app, **gzip_options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await self.gzip(scope, receive, send)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="BRICS Risk API",
@@ -39,201 +300,195 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=RiskJSONResponse,
+    lifespan=lifespan,
 )
 
+# Path of the NDJSON snapshot stream, which must bypass the compressor
+STREAM_PATH = "/api/v1/risk/stream"
+
+# Signed payloads repeat long key names and hex digests, so they compress well
+app.add_middleware(StreamingSafeGZipMiddleware, exclude_paths=(STREAM_PATH,), minimum_size=GZIP_MINIMUM_SIZE)
 
-@app.get("/api/v1/health", response_model=HealthResponse, tags=["health"])
-async def health_check() -> HealthResponse:
+
+def _signed_snapshot() -> Dict[str, Any]:
+    """All four signed feeds, from one consistent snapshot, keyed by section."""
+    snapshot = state.SNAPSHOT_STORE.current()
+    return {
+        "nav": _signed_nav_latest(snapshot.nav),
+        "emergency": _signed_emergency_level(snapshot.emergency),
+        "issuance": _signed_issuance_state(snapshot.issuance),
+        "risk": _signed_risk_summary(snapshot.risk),
+    }
+
+
+async def _snapshot_events(interval_s: float, max_events: Optional[int]) -> AsyncIterator[bytes]:
+    """Yield one NDJSON-encoded signed snapshot per interval."""
+    sent = 0
+    while max_events is None or sent < max_events:
+        if sent:
+            await asyncio.sleep(interval_s)
+        yield render_json(_signed_snapshot()) + b"\n"
+        sent += 1
+
+
+@app.get("/api/v1/health", response_model=None, responses={200: {"model": HealthResponse}}, tags=["health"])
+async def health_check() -> RiskJSONResponse:
     """Health check endpoint.
     
     Returns:
         Service status and current timestamp
     """
-    return HealthResponse(
+    return _trusted_response(
+        HealthResponse,
         status="ok",
-        ts=int(time.time()),
+        ts=now_s(),
     )
 
 
-@app.get("/.well-known/risk-api-pubkey", response_model=PublicKeyResponse, tags=["public"])
-async def get_public_key(signing_key: SigningKey = Depends(get_signing_key)) -> PublicKeyResponse:
+@lru_cache(maxsize=None)
+def _public_key_body(public_key_hex: str) -> bytes:
+    """Encoded public key response body; fixed for the lifetime of a key."""
+    return render_json(_trusted_fields(PublicKeyResponse, ed25519_pubkey_hex=public_key_hex))
+
+
+@app.get("/.well-known/risk-api-pubkey", response_model=None, responses={200: {"model": PublicKeyResponse}}, tags=["public"])
+async def get_public_key() -> Response:
     """Get public key for signature verification.
     
-    Args:
-        signing_key: Ed25519 signing key instance
-        
     Returns:
         Hex-encoded Ed25519 public key
     """
-    return PublicKeyResponse(
-        ed25519_pubkey_hex=signing_key.public_key_hex(),
+    return Response(
+        _public_key_body(state.get_signing_key().public_key_hex()),
+        media_type="application/json",
     )
 
 
-@app.get("/api/v1/nav/latest", response_model=NavLatestResponse, tags=["nav"])
-async def get_nav_latest(
-    signing_key: SigningKey = Depends(get_signing_key),
-    nav_provider = Depends(get_nav_provider),
-) -> NavLatestResponse:
+@app.get("/api/v1/nav/latest", response_model=None, responses={200: {"model": NavLatestResponse}}, tags=["nav"])
+async def get_nav_latest() -> Response:
     """Get latest NAV data with emergency fallback.
     
-    Args:
-        signing_key: Ed25519 signing key instance
-        nav_provider: NAV data provider
-        
+    Served from the prefetched feed snapshot, so it may lag provider
+    changes by up to SNAPSHOT_REFRESH_INTERVAL_S (0.5 s).
+    
     Returns:
         NAV data with Ed25519 signature
     """
-    # Get NAV data
-    nav_data = nav_provider.get_nav_data()
-    
-    # Generate signature
-    signature = signing_key.sign(nav_data)
-    
-    return NavLatestResponse(
-        nav_ray=nav_data["nav_ray"],
-        model_hash=nav_data["model_hash"],
-        emergency_nav_ray=nav_data["emergency_nav_ray"],
-        emergency_enabled=nav_data["emergency_enabled"],
-        ts=nav_data["ts"],
-        sig=signature,
+    return Response(
+        _signed_body(_signed_nav_latest, state.SNAPSHOT_STORE.current().nav),
+        media_type="application/json",
     )
 
 
-@app.get("/api/v1/emergency/level", response_model=EmergencyLevelResponse, tags=["emergency"])
-async def get_emergency_level(
-    signing_key: SigningKey = Depends(get_signing_key),
-    emergency_provider = Depends(get_emergency_provider),
-) -> EmergencyLevelResponse:
+@app.get("/api/v1/emergency/level", response_model=None, responses={200: {"model": EmergencyLevelResponse}}, tags=["emergency"])
+async def get_emergency_level() -> Response:
     """Get current emergency state.
     
-    Args:
-        signing_key: Ed25519 signing key instance
-        emergency_provider: Emergency state provider
-        
+    Served from the prefetched feed snapshot, so it may lag provider
+    changes by up to SNAPSHOT_REFRESH_INTERVAL_S (0.5 s).
+    
     Returns:
         Emergency state with Ed25519 signature
     """
-    # Get emergency data
-    emergency_data = emergency_provider.get_emergency_data()
-    
-    # Generate signature
-    signature = signing_key.sign(emergency_data)
-    
-    return EmergencyLevelResponse(
-        level=emergency_data["level"],
-        reason=emergency_data["reason"],
-        ts=emergency_data["ts"],
-        sig=signature,
+    return Response(
+        _signed_body(_signed_emergency_level, state.SNAPSHOT_STORE.current().emergency),
+        media_type="application/json",
     )
 
 
-@app.get("/api/v1/issuance/state", response_model=IssuanceStateResponse, tags=["issuance"])
-async def get_issuance_state(
-    signing_key: SigningKey = Depends(get_signing_key),
-    issuance_provider = Depends(get_issuance_provider),
-) -> IssuanceStateResponse:
+@app.get("/api/v1/issuance/state", response_model=None, responses={200: {"model": IssuanceStateResponse}}, tags=["issuance"])
+async def get_issuance_state() -> Response:
     """Get current issuance controller state.
     
-    Args:
-        signing_key: Ed25519 signing key instance
-        issuance_provider: Issuance state provider
-        
+    Served from the prefetched feed snapshot, so it may lag provider
+    changes by up to SNAPSHOT_REFRESH_INTERVAL_S (0.5 s).
+    
     Returns:
         Issuance state with Ed25519 signature
     """
-    # Get issuance data
-    issuance_data = issuance_provider.get_issuance_data()
-    
-    # Generate signature
-    signature = signing_key.sign(issuance_data)
-    
-    return IssuanceStateResponse(
-        locked=issuance_data["locked"],
-        cap_tokens=issuance_data["cap_tokens"],
-        detach_bps=issuance_data["detach_bps"],
-        ratify_until=issuance_data["ratify_until"],
-        ts=issuance_data["ts"],
-        sig=signature,
+    return Response(
+        _signed_body(_signed_issuance_state, state.SNAPSHOT_STORE.current().issuance),
+        media_type="application/json",
     )
 
 
-@app.get("/api/v1/risk/summary", response_model=RiskSummaryResponse, tags=["risk"])
-async def get_risk_summary(
-    signing_key: SigningKey = Depends(get_signing_key),
-    risk_provider = Depends(get_risk_provider),
-) -> RiskSummaryResponse:
+@app.get("/api/v1/risk/summary", response_model=None, responses={200: {"model": RiskSummaryResponse}}, tags=["risk"])
+async def get_risk_summary() -> Response:
     """Get aggregate risk metrics summary.
     
-    Args:
-        signing_key: Ed25519 signing key instance
-        risk_provider: Risk metrics provider
-        
+    Served from the prefetched feed snapshot, so it may lag provider
+    changes by up to SNAPSHOT_REFRESH_INTERVAL_S (0.5 s).
+    
     Returns:
         Risk summary with Ed25519 signature
     """
-    # Get risk data
-    risk_data = risk_provider.get_risk_data()
+    return Response(
+        _signed_body(_signed_risk_summary, state.SNAPSHOT_STORE.current().risk),
+        media_type="application/json",
+    )
+
+
+@app.get("/api/v1/snapshot", response_model=None, responses={200: {"model": SnapshotResponse}}, tags=["snapshot"])
+async def get_snapshot() -> RiskJSONResponse:
+    """Get NAV, emergency, issuance and risk feeds in one response.
     
-    # Generate signature
-    signature = signing_key.sign(risk_data)
+    Each section is signed exactly as its standalone endpoint, so existing
+    verification clients can check them individually.
     
-    return RiskSummaryResponse(
-        defaults_bps=risk_data["defaults_bps"],
-        sovereign_usage_bps=risk_data["sovereign_usage_bps"],
-        correlation_bps=risk_data["correlation_bps"],
-        ts=risk_data["ts"],
-        sig=signature,
+    Served from the prefetched feed snapshot, so it may lag provider
+    changes by up to SNAPSHOT_REFRESH_INTERVAL_S (0.5 s).
+    
+    Returns:
+        All four signed feeds keyed by section
+    """
+    return RiskJSONResponse(_signed_snapshot())
+
+
+@app.get(STREAM_PATH, response_class=StreamingResponse, tags=["snapshot"])
+async def stream_snapshots(max_events: Optional[int] = None) -> StreamingResponse:
+    """Stream signed snapshots as newline-delimited JSON.
+    
+    Args:
+        max_events: Stop after this many events (optional, default: unbounded)
+        
+    Returns:
+        One snapshot (same shape as /api/v1/snapshot) per line
+    """
+    return StreamingResponse(
+        _snapshot_events(STREAM_INTERVAL_S, max_events),
+        media_type="application/x-ndjson",
     )
 
 
-@app.get("/api/v1/lane/pretrade", response_model=LanePretradeResponse, tags=["safety"])
+@app.get("/api/v1/lane/pretrade", response_model=None, responses={200: {"model": LanePretradeResponse}}, tags=["safety"])
 async def get_lane_pretrade_check(
     price_bps: int,
     emergency_level: int,
-    signing_key: SigningKey = Depends(get_signing_key),
-    safety_provider = Depends(get_safety_provider),
-) -> LanePretradeResponse:
+) -> RiskJSONResponse:
     """Get lane pre-trade check for price bounds validation.
     
     Args:
         price_bps: Price in basis points (e.g., 10000 = 100%)
         emergency_level: Emergency level to check bounds for
-        signing_key: Ed25519 signing key instance
-        safety_provider: Safety check provider
         
     Returns:
         Pre-trade check result with Ed25519 signature
     """
-    # Get pre-trade data
-    pretrade_data = safety_provider.get_lane_pretrade_data(price_bps, emergency_level)
-    
-    # Add timestamp
-    pretrade_data["ts"] = int(time.time())
-    
-    # Generate signature
-    signature = signing_key.sign(pretrade_data)
-    
-    return LanePretradeResponse(
-        ok=pretrade_data["ok"],
-        min_bps=pretrade_data["min_bps"],
-        max_bps=pretrade_data["max_bps"],
-        price_bps=pretrade_data["price_bps"],
-        emergency_level=pretrade_data["emergency_level"],
-        ts=pretrade_data["ts"],
-        sig=signature,
+    return RiskJSONResponse(
+        await _signed_safety_check(
+            _lane_pretrade_fields, _signed_lane_pretrade, price_bps, emergency_level, now_s()
+        )
     )
 
 
-@app.get("/api/v1/oracle/nav-sanity", response_model=NavSanityResponse, tags=["safety"])
+@app.get("/api/v1/oracle/nav-sanity", response_model=None, responses={200: {"model": NavSanityResponse}}, tags=["safety"])
 async def get_nav_sanity_check(
     proposed_nav_ray: int,
     max_jump_bps: int = 500,
     emergency: int = 0,
     prev_nav_ray: int = None,
-    signing_key: SigningKey = Depends(get_signing_key),
-    safety_provider = Depends(get_safety_provider),
-) -> NavSanityResponse:
+) -> RiskJSONResponse:
     """Get NAV sanity check for proposed NAV changes.
     
     Args:
@@ -241,35 +496,15 @@ async def get_nav_sanity_check(
         max_jump_bps: Maximum allowed jump in basis points (default: 500)
         emergency: Whether emergency mode is enabled (0/1, default: 0)
         prev_nav_ray: Previous NAV in ray format (optional)
-        signing_key: Ed25519 signing key instance
-        safety_provider: Safety check provider
         
     Returns:
         NAV sanity check result with Ed25519 signature
     """
-    # Get NAV sanity data
-    nav_sanity_data = safety_provider.get_nav_sanity_data(
-        proposed_nav_ray=proposed_nav_ray,
-        max_jump_bps=max_jump_bps,
-        emergency_enabled=emergency,
-        prev_nav_ray=prev_nav_ray,
-    )
-    
-    # Add timestamp
-    nav_sanity_data["ts"] = int(time.time())
-    
-    # Generate signature
-    signature = signing_key.sign(nav_sanity_data)
-    
-    return NavSanityResponse(
-        ok=nav_sanity_data["ok"],
-        prev_nav_ray=nav_sanity_data["prev_nav_ray"],
-        proposed_nav_ray=nav_sanity_data["proposed_nav_ray"],
-        max_jump_bps=nav_sanity_data["max_jump_bps"],
-        emergency_enabled=nav_sanity_data["emergency_enabled"],
-        assumed_prev=nav_sanity_data["assumed_prev"],
-        ts=nav_sanity_data["ts"],
-        sig=signature,
+    return RiskJSONResponse(
+        await _signed_safety_check(
+            _nav_sanity_fields, _signed_nav_sanity,
+            proposed_nav_ray, max_jump_bps, emergency, prev_nav_ray, now_s(),
+        )
     )
 
 
@@ -289,11 +524,18 @@ def main() -> None:
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
     
+    # Reload is development-only; it forces a single worker process
+    reload = os.getenv("RELOAD", "0") == "1"
+    workers = 1 if reload else int(os.getenv("WORKERS", str(os.cpu_count() or 1)))
+    
     uvicorn.run(
         "risk_api.app:app",
         host=host,
         port=port,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=reload,
+        workers=workers,
     )
 
 
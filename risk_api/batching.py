@@ -0,0 +1,93 @@
+"""
+BRICS Risk API - Batched response signing.
+
+Collects signing requests from concurrent handlers and signs them in groups on
+a worker thread, so a burst of safety checks costs one thread hop per batch
+instead of signing inline on the event loop for every request.
+"""
+
+import asyncio
+from typing import Callable, List, Optional, Tuple
+
+
+# A pending signing request: canonical bytes and the future awaiting its signature
+_Pending = Tuple[bytes, "asyncio.Future[str]"]
+
+
+class BatchSigner:
+    """Queue that signs canonical payloads in batches while it is running."""
+
+    def __init__(self, sign_many: Callable[[List[bytes]], List[str]]) -> None:
+        """Initialize a stopped signer.
+
+        Args:
+            sign_many: Callable returning one hex signature per canonical payload
+        """
+        self._sign_many = sign_many
+        self._queue: Optional["asyncio.Queue[_Pending]"] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the batching task is draining the queue."""
+        return self._queue is not None
+
+    async def sign(self, canonical_bytes: bytes) -> str:
+        """Sign canonical bytes, batched with concurrent requests when running.
+
+        Signs inline when the batching task is not running (e.g. outside the
+        application lifespan).
+
+        Args:
+            canonical_bytes: Canonical JSON bytes (see signing.canonical_json)
+
+        Returns:
+            Hex-encoded Ed25519 signature
+        """
+        queue = self._queue
+        if queue is None:
+            return self._sign_many([canonical_bytes])[0]
+        future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+        queue.put_nowait((canonical_bytes, future))
+        return await future
+
+    async def run(self, max_batch: int, max_delay_s: float) -> None:
+        """Drain the queue in batches until cancelled.
+
+        A batch is signed once ``max_batch`` requests are waiting or
+        ``max_delay_s`` after its first request arrived, whichever is sooner.
+
+        Args:
+            max_batch: Largest number of payloads signed in one worker call
+            max_delay_s: Longest a request waits for others to join its batch
+        """
+        queue: "asyncio.Queue[_Pending]" = asyncio.Queue()
+        self._queue = queue
+        batch: List[_Pending] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                if queue.qsize() < max_batch - 1:
+                    await asyncio.sleep(max_delay_s)
+                while len(batch) < max_batch and not queue.empty():
+                    batch.append(queue.get_nowait())
+                await self._sign_batch(batch)
+                batch = []
+        finally:
+            self._queue = None
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            for _, future in batch:
+                future.cancel()
+
+    async def _sign_batch(self, batch: List[_Pending]) -> None:
+        """Sign one batch on a worker thread and resolve its futures."""
+        try:
+            signatures = await asyncio.to_thread(self._sign_many, [message for message, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), signature in zip(batch, signatures):
+            if not future.done():
+                future.set_result(signature)
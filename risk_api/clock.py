@@ -0,0 +1,40 @@
+"""
+BRICS Risk API - Cached second-granularity clock.
+
+Provides a Unix timestamp refreshed by a background ticker so handlers and
+providers read a cached value instead of calling time.time() per response.
+"""
+
+import asyncio
+import time
+
+# Seconds past each whole second at which the ticker wakes, so the refresh
+# lands after the boundary despite timer jitter
+TICK_SLACK_S = 0.001
+
+_cached_ts = int(time.time())
+_ticker_running = False
+
+
+def now_s() -> int:
+    """Get current Unix timestamp in seconds.
+    
+    Returns the ticker's cached value while the ticker is running, otherwise
+    reads the system clock directly (e.g. outside the application lifespan).
+    """
+    if _ticker_running:
+        return _cached_ts
+    return int(time.time())
+
+
+async def run_ticker() -> None:
+    """Refresh the cached timestamp on each whole second until cancelled."""
+    global _cached_ts, _ticker_running
+    _ticker_running = True
+    try:
+        while True:
+            now = time.time()
+            _cached_ts = int(now)
+            await asyncio.sleep(1.0 - now % 1.0 + TICK_SLACK_S)
+    finally:
+        _ticker_running = False
@@ -1,25 +1,18 @@
 """
-BRICS Risk API - FastAPI dependencies and initialization.
+BRICS Risk API - FastAPI dependencies.
 
-Provides dependency injection for signing key and data providers,
-with environment configuration loading.
+Provides dependency-injection accessors for the signing key and data providers
+held in risk_api.state, for callers that prefer ``Depends``/``dependency_overrides``.
+Built-in handlers read risk_api.state directly to skip dependency resolution.
 """
 
-import os
-from functools import lru_cache
 from typing import Dict, Any
 
-from dotenv import load_dotenv
-
+from . import state
 from .providers import NavProvider, EmergencyProvider, IssuanceProvider, RiskProvider, SafetyProvider
 from .signing import SigningKey
 
 
-# Load environment variables from .env file if present
-load_dotenv()
-
-
-@lru_cache()
 def get_signing_key() -> SigningKey:
     """Get cached signing key instance.
     
@@ -29,49 +22,44 @@ def get_signing_key() -> SigningKey:
     Raises:
         ValueError: If RISK_API_ED25519_SK_HEX is not set or invalid
     """
-    secret_key_hex = os.getenv('RISK_API_ED25519_SK_HEX')
-    if not secret_key_hex:
-        raise ValueError("RISK_API_ED25519_SK_HEX environment variable is required")
-    
-    return SigningKey(secret_key_hex)
+    return state.get_signing_key()
 
 
-@lru_cache()
 def get_providers() -> Dict[str, Any]:
-    """Get cached data providers.
+    """Get data providers.
     
     Returns:
         Dictionary with all data providers
     """
     return {
-        "nav": NavProvider(),
-        "emergency": EmergencyProvider(),
-        "issuance": IssuanceProvider(),
-        "risk": RiskProvider(),
-        "safety": SafetyProvider(),
+        "nav": state.NAV_PROVIDER,
+        "emergency": state.EMERGENCY_PROVIDER,
+        "issuance": state.ISSUANCE_PROVIDER,
+        "risk": state.RISK_PROVIDER,
+        "safety": state.SAFETY_PROVIDER,
     }
 
 
 def get_nav_provider() -> NavProvider:
     """Get NAV provider instance."""
-    return get_providers()["nav"]
+    return state.NAV_PROVIDER
 
 
 def get_emergency_provider() -> EmergencyProvider:
     """Get emergency provider instance."""
-    return get_providers()["emergency"]
+    return state.EMERGENCY_PROVIDER
 
 
 def get_issuance_provider() -> IssuanceProvider:
     """Get issuance provider instance."""
-    return get_providers()["issuance"]
+    return state.ISSUANCE_PROVIDER
 
 
 def get_risk_provider() -> RiskProvider:
     """Get risk provider instance."""
-    return get_providers()["risk"]
+    return state.RISK_PROVIDER
 
 
 def get_safety_provider() -> SafetyProvider:
     """Get safety provider instance."""
-    return get_providers()["safety"]
+    return state.SAFETY_PROVIDER
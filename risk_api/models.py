@@ -3,25 +3,42 @@ BRICS Risk API - Pydantic models for API responses.
 
 Defines response schemas for all endpoints with proper typing and validation.
 All models include timestamp and optional signature fields.
+
+Safety check models carry a ``CANON_TEMPLATE`` that renders their unsigned
+fields directly into canonical JSON (sorted keys, no whitespace) for signing.
 """
 
-from typing import Optional
+from typing import ClassVar, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
 
-from pydantic import BaseModel, Field
+class ResponseModel(BaseModel):
+    """Base model for output-only API responses.
+    
+    Responses are built once from trusted provider data and never mutated, so
+    assignment validation is off and instances are frozen.
+    """
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
+        protected_namespaces=(),  # allow fields such as model_hash
+    )
 
 
-class StampedModel(BaseModel):
+class StampedModel(ResponseModel):
     """Base model with timestamp field."""
     ts: int = Field(..., description="Unix timestamp in seconds")
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(ResponseModel):
     """Health check response."""
     status: str = Field(..., description="Service status")
     ts: int = Field(..., description="Unix timestamp in seconds")
 
 
-class PublicKeyResponse(BaseModel):
+class PublicKeyResponse(ResponseModel):
     """Public key response for signature verification."""
     ed25519_pubkey_hex: str = Field(..., description="Hex-encoded Ed25519 public key")
 
@@ -68,6 +85,16 @@ class LanePretradeResponse(StampedModel):
     emergency_level: int = Field(..., description="Emergency level checked")
     sig: Optional[str] = Field(None, description="Ed25519 signature of canonical JSON")
 
+    CANON_TEMPLATE: ClassVar[str] = (
+        '{"emergency_level":%(emergency_level)d'
+        ',"max_bps":%(max_bps)d'
+        ',"min_bps":%(min_bps)d'
+        ',"ok":%(ok)d'
+        ',"price_bps":%(price_bps)d'
+        ',"ts":%(ts)d'
+        '}'
+    )
+
 
 class NavSanityResponse(StampedModel):
     """NAV sanity check response."""
@@ -78,3 +105,22 @@ class NavSanityResponse(StampedModel):
     emergency_enabled: int = Field(..., description="Emergency mode enabled (0/1)")
     assumed_prev: int = Field(..., description="Whether previous NAV was assumed (0/1)")
     sig: Optional[str] = Field(None, description="Ed25519 signature of canonical JSON")
+
+    CANON_TEMPLATE: ClassVar[str] = (
+        '{"assumed_prev":%(assumed_prev)d'
+        ',"emergency_enabled":%(emergency_enabled)d'
+        ',"max_jump_bps":%(max_jump_bps)d'
+        ',"ok":%(ok)d'
+        ',"prev_nav_ray":%(prev_nav_ray)d'
+        ',"proposed_nav_ray":%(proposed_nav_ray)d'
+        ',"ts":%(ts)d'
+        '}'
+    )
+
+
+class SnapshotResponse(ResponseModel):
+    """Combined feed snapshot; each section carries its own signature."""
+    nav: NavLatestResponse = Field(..., description="Latest NAV data")
+    emergency: EmergencyLevelResponse = Field(..., description="Emergency state")
+    issuance: IssuanceStateResponse = Field(..., description="Issuance controller state")
+    risk: RiskSummaryResponse = Field(..., description="Risk metrics summary")
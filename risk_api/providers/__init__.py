@@ -5,10 +5,20 @@ Contains in-memory data providers for NAV, emergency state, issuance, and risk m
 These are temporary implementations that will be replaced with on-chain adapters.
 """
 
-from .emergency import EmergencyProvider
-from .issuance import IssuanceProvider
-from .nav import NavProvider
-from .risk import RiskProvider
+from .emergency import EmergencyData, EmergencyProvider
+from .issuance import IssuanceData, IssuanceProvider
+from .nav import NavData, NavProvider
+from .risk import RiskData, RiskProvider
 from .safety import SafetyProvider
 
-__all__ = ["NavProvider", "EmergencyProvider", "IssuanceProvider", "RiskProvider", "SafetyProvider"]
+__all__ = [
+    "NavProvider",
+    "EmergencyProvider",
+    "IssuanceProvider",
+    "RiskProvider",
+    "SafetyProvider",
+    "NavData",
+    "EmergencyData",
+    "IssuanceData",
+    "RiskData",
+]
@@ -6,36 +6,68 @@ TODO: Replace with on-chain ConfigRegistry adapter.
 """
 
 import os
-import time
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Tuple
+
+from ..clock import now_s
+from ..signing import canonical_prefix
+
+
+@lru_cache(maxsize=1)
+def _load_config() -> Tuple[int, str]:
+    """Parse emergency provider settings from the environment once per process.
+    
+    Call ``_load_config.cache_clear()`` after changing the environment in tests.
+    """
+    return (
+        int(os.getenv("EMERGENCY_LEVEL", "0")),
+        os.getenv("EMERGENCY_REASON", "normal"),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class EmergencyData:
+    """Emergency state snapshot."""
+    level: int
+    reason: str
+    ts: int
+    canon_prefix: bytes = field(repr=False, compare=False)
 
 
 class EmergencyProvider:
     """In-memory emergency state provider with environment configuration."""
 
+    __slots__ = ("_level", "_reason", "_canon_prefix")
+
     def __init__(self) -> None:
         """Initialize emergency provider with values from environment."""
         # TODO: Replace with on-chain ConfigRegistry adapter
-        self._level = int(os.getenv("EMERGENCY_LEVEL", "0"))
-        self._reason = os.getenv("EMERGENCY_REASON", "normal")
+        self._level, self._reason = _load_config()
+        self._refresh_canon_prefix()
 
-    def get_emergency_data(self) -> Dict[str, Any]:
+    def get_emergency_data(self) -> EmergencyData:
         """Get current emergency state data.
         
         Returns:
-            Dictionary with level, reason, ts
+            EmergencyData with level, reason, ts
         """
-        return {
+        return EmergencyData(self._level, self._reason, now_s(), self._canon_prefix)
+
+    def _refresh_canon_prefix(self) -> None:
+        """Precompute canonical JSON of the static (non-ts) fields."""
+        self._canon_prefix = canonical_prefix({
             "level": self._level,
             "reason": self._reason,
-            "ts": int(time.time()),
-        }
+        })
 
     # Test methods for setting values
     def _set_level(self, level: int) -> None:
         """Set emergency level (for testing only)."""
         self._level = level
+        self._refresh_canon_prefix()
 
     def _set_reason(self, reason: str) -> None:
         """Set emergency reason (for testing only)."""
         self._reason = reason
+        self._refresh_canon_prefix()
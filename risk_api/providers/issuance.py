@@ -6,48 +6,91 @@ TODO: Replace with on-chain IssuanceControllerV4 adapter.
 """
 
 import os
-import time
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Tuple
+
+from ..clock import now_s
+from ..signing import canonical_prefix
+
+
+@lru_cache(maxsize=1)
+def _load_config() -> Tuple[int, int, int, int]:
+    """Parse issuance provider settings from the environment once per process.
+    
+    Call ``_load_config.cache_clear()`` after changing the environment in tests.
+    """
+    return (
+        int(os.getenv("ISS_LOCKED", "0")),
+        int(os.getenv("ISS_CAP_TOKENS", "4440000000000000000000000")),
+        int(os.getenv("ISS_DETACH_BPS", "10200")),
+        int(os.getenv("ISS_RATIFY_UNTIL", "0")),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class IssuanceData:
+    """Issuance controller state snapshot."""
+    locked: int
+    cap_tokens: int
+    detach_bps: int
+    ratify_until: int
+    ts: int
+    canon_prefix: bytes = field(repr=False, compare=False)
 
 
 class IssuanceProvider:
     """In-memory issuance state provider with environment configuration."""
 
+    __slots__ = ("_locked", "_cap_tokens", "_detach_bps", "_ratify_until", "_canon_prefix")
+
     def __init__(self) -> None:
         """Initialize issuance provider with values from environment."""
         # TODO: Replace with on-chain IssuanceControllerV4 adapter
-        self._locked = int(os.getenv("ISS_LOCKED", "0"))
-        self._cap_tokens = int(os.getenv("ISS_CAP_TOKENS", "4440000000000000000000000"))
-        self._detach_bps = int(os.getenv("ISS_DETACH_BPS", "10200"))
-        self._ratify_until = int(os.getenv("ISS_RATIFY_UNTIL", "0"))
+        self._locked, self._cap_tokens, self._detach_bps, self._ratify_until = _load_config()
+        self._refresh_canon_prefix()
 
-    def get_issuance_data(self) -> Dict[str, Any]:
+    def get_issuance_data(self) -> IssuanceData:
         """Get current issuance state data.
         
         Returns:
-            Dictionary with locked, cap_tokens, detach_bps, ratify_until, ts
+            IssuanceData with locked, cap_tokens, detach_bps, ratify_until, ts
         """
-        return {
+        return IssuanceData(
+            self._locked,
+            self._cap_tokens,
+            self._detach_bps,
+            self._ratify_until,
+            now_s(),
+            self._canon_prefix,
+        )
+
+    def _refresh_canon_prefix(self) -> None:
+        """Precompute canonical JSON of the static (non-ts) fields."""
+        self._canon_prefix = canonical_prefix({
             "locked": self._locked,
             "cap_tokens": self._cap_tokens,
             "detach_bps": self._detach_bps,
             "ratify_until": self._ratify_until,
-            "ts": int(time.time()),
-        }
+        })
 
     # Test methods for setting values
     def _set_locked(self, locked: int) -> None:
         """Set issuance locked status (for testing only)."""
         self._locked = locked
+        self._refresh_canon_prefix()
 
     def _set_cap_tokens(self, cap_tokens: int) -> None:
         """Set issuance cap (for testing only)."""
         self._cap_tokens = cap_tokens
+        self._refresh_canon_prefix()
 
     def _set_detach_bps(self, detach_bps: int) -> None:
         """Set detachment basis points (for testing only)."""
         self._detach_bps = detach_bps
+        self._refresh_canon_prefix()
 
     def _set_ratify_until(self, ratify_until: int) -> None:
         """Set ratification deadline (for testing only)."""
         self._ratify_until = ratify_until
+        self._refresh_canon_prefix()
@@ -6,48 +6,91 @@ TODO: Replace with on-chain NAVOracleV3 adapter.
 """
 
 import os
-import time
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Tuple
+
+from ..clock import now_s
+from ..signing import canonical_prefix
+
+
+@lru_cache(maxsize=1)
+def _load_config() -> Tuple[int, str, int, int]:
+    """Parse NAV provider settings from the environment once per process.
+    
+    Call ``_load_config.cache_clear()`` after changing the environment in tests.
+    """
+    return (
+        int(os.getenv("NAV_RAY", "1000000000000000000000000000")),
+        os.getenv("NAV_MODEL_HASH", "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"),
+        int(os.getenv("EMERGENCY_NAV_RAY", "1000000000000000000000000000")),
+        int(os.getenv("EMERGENCY_ENABLED", "0")),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class NavData:
+    """NAV snapshot with emergency fallback values."""
+    nav_ray: int
+    model_hash: str
+    emergency_nav_ray: int
+    emergency_enabled: int
+    ts: int
+    canon_prefix: bytes = field(repr=False, compare=False)
 
 
 class NavProvider:
     """In-memory NAV data provider with environment configuration."""
 
+    __slots__ = ("_nav_ray", "_model_hash", "_emergency_nav_ray", "_emergency_enabled", "_canon_prefix")
+
     def __init__(self) -> None:
         """Initialize NAV provider with values from environment."""
         # TODO: Replace with on-chain NAVOracleV3 adapter
-        self._nav_ray = int(os.getenv("NAV_RAY", "1000000000000000000000000000"))
-        self._model_hash = os.getenv("NAV_MODEL_HASH", "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef")
-        self._emergency_nav_ray = int(os.getenv("EMERGENCY_NAV_RAY", "1000000000000000000000000000"))
-        self._emergency_enabled = int(os.getenv("EMERGENCY_ENABLED", "0"))
+        self._nav_ray, self._model_hash, self._emergency_nav_ray, self._emergency_enabled = _load_config()
+        self._refresh_canon_prefix()
 
-    def get_nav_data(self) -> Dict[str, Any]:
+    def get_nav_data(self) -> NavData:
         """Get current NAV data.
         
         Returns:
-            Dictionary with nav_ray, model_hash, emergency_nav_ray, emergency_enabled, ts
+            NavData with nav_ray, model_hash, emergency_nav_ray, emergency_enabled, ts
         """
-        return {
+        return NavData(
+            self._nav_ray,
+            self._model_hash,
+            self._emergency_nav_ray,
+            self._emergency_enabled,
+            now_s(),
+            self._canon_prefix,
+        )
+
+    def _refresh_canon_prefix(self) -> None:
+        """Precompute canonical JSON of the static (non-ts) fields."""
+        self._canon_prefix = canonical_prefix({
             "nav_ray": self._nav_ray,
             "model_hash": self._model_hash,
             "emergency_nav_ray": self._emergency_nav_ray,
             "emergency_enabled": self._emergency_enabled,
-            "ts": int(time.time()),
-        }
+        })
 
     # Test methods for setting values
     def _set_nav_ray(self, nav_ray: int) -> None:
         """Set NAV ray value (for testing only)."""
         self._nav_ray = nav_ray
+        self._refresh_canon_prefix()
 
     def _set_model_hash(self, model_hash: str) -> None:
         """Set model hash (for testing only)."""
         self._model_hash = model_hash
+        self._refresh_canon_prefix()
 
     def _set_emergency_nav_ray(self, emergency_nav_ray: int) -> None:
         """Set emergency NAV ray (for testing only)."""
         self._emergency_nav_ray = emergency_nav_ray
+        self._refresh_canon_prefix()
 
     def _set_emergency_enabled(self, emergency_enabled: int) -> None:
         """Set emergency enabled flag (for testing only)."""
         self._emergency_enabled = emergency_enabled
+        self._refresh_canon_prefix()
@@ -6,42 +6,82 @@ TODO: Replace with on-chain risk calculation adapter.
 """
 
 import os
-import time
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Tuple
+
+from ..clock import now_s
+from ..signing import canonical_prefix
+
+
+@lru_cache(maxsize=1)
+def _load_config() -> Tuple[int, int, int]:
+    """Parse risk provider settings from the environment once per process.
+    
+    Call ``_load_config.cache_clear()`` after changing the environment in tests.
+    """
+    return (
+        int(os.getenv("RISK_DEFAULTS_BPS", "300")),
+        int(os.getenv("RISK_SOVEREIGN_USAGE_BPS", "0")),
+        int(os.getenv("RISK_CORRELATION_BPS", "250")),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class RiskData:
+    """Aggregate risk metrics snapshot."""
+    defaults_bps: int
+    sovereign_usage_bps: int
+    correlation_bps: int
+    ts: int
+    canon_prefix: bytes = field(repr=False, compare=False)
 
 
 class RiskProvider:
     """In-memory risk metrics provider with environment configuration."""
 
+    __slots__ = ("_defaults_bps", "_sovereign_usage_bps", "_correlation_bps", "_canon_prefix")
+
     def __init__(self) -> None:
         """Initialize risk provider with values from environment."""
         # TODO: Replace with on-chain risk calculation adapter
-        self._defaults_bps = int(os.getenv("RISK_DEFAULTS_BPS", "300"))
-        self._sovereign_usage_bps = int(os.getenv("RISK_SOVEREIGN_USAGE_BPS", "0"))
-        self._correlation_bps = int(os.getenv("RISK_CORRELATION_BPS", "250"))
+        self._defaults_bps, self._sovereign_usage_bps, self._correlation_bps = _load_config()
+        self._refresh_canon_prefix()
 
-    def get_risk_data(self) -> Dict[str, Any]:
+    def get_risk_data(self) -> RiskData:
         """Get current risk metrics data.
         
         Returns:
-            Dictionary with defaults_bps, sovereign_usage_bps, correlation_bps, ts
+            RiskData with defaults_bps, sovereign_usage_bps, correlation_bps, ts
         """
-        return {
+        return RiskData(
+            self._defaults_bps,
+            self._sovereign_usage_bps,
+            self._correlation_bps,
+            now_s(),
+            self._canon_prefix,
+        )
+
+    def _refresh_canon_prefix(self) -> None:
+        """Precompute canonical JSON of the static (non-ts) fields."""
+        self._canon_prefix = canonical_prefix({
             "defaults_bps": self._defaults_bps,
             "sovereign_usage_bps": self._sovereign_usage_bps,
             "correlation_bps": self._correlation_bps,
-            "ts": int(time.time()),
-        }
+        })
 
     # Test methods for setting values
     def _set_defaults_bps(self, defaults_bps: int) -> None:
         """Set defaults basis points (for testing only)."""
         self._defaults_bps = defaults_bps
+        self._refresh_canon_prefix()
 
     def _set_sovereign_usage_bps(self, sovereign_usage_bps: int) -> None:
         """Set sovereign usage basis points (for testing only)."""
         self._sovereign_usage_bps = sovereign_usage_bps
+        self._refresh_canon_prefix()
 
     def _set_correlation_bps(self, correlation_bps: int) -> None:
         """Set correlation basis points (for testing only)."""
         self._correlation_bps = correlation_bps
+        self._refresh_canon_prefix()
@@ -7,21 +7,35 @@ These are pure functions that mirror the on-chain logic without RPC dependencies
 
 import json
 import os
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+
+# Price bounds (min_bps, max_bps) per emergency level (matching InstantLane.sol)
+_BOUNDS: Tuple[Tuple[int, int], ...] = (
+    (9800, 10200),   # Level 0: ±2%
+    (9900, 10100),   # Level 1: ±1%
+    (9975, 10025),   # Level 2: ±0.25%
+)
+_MOST_RESTRICTIVE_LEVEL = len(_BOUNDS) - 1
+
+# Last parsed .devstack/addresses.json as (path, mtime_ns, addresses)
+_ADDR_CACHE: Optional[Tuple[str, int, Optional[Dict[str, str]]]] = None
+
+@lru_cache(maxsize=128)
+def _nav_bounds(prev_nav_ray: int, max_jump_bps: int) -> Tuple[int, int]:
+    """Allowed (lo, hi) NAV range around prev_nav_ray, memoized by inputs."""
+    lo = prev_nav_ray * (10000 - max_jump_bps) // 10000
+    hi = prev_nav_ray * (10000 + max_jump_bps) // 10000
+    return lo, hi
 
 
 class SafetyProvider:
     """Safety check provider with pure function implementations."""
 
+    __slots__ = ("_default_max_jump_bps", "_default_prev_nav_ray")
+
     def __init__(self) -> None:
         """Initialize safety provider."""
-        # Default bounds for emergency levels (matching InstantLane.sol)
-        self._bounds = {
-            0: (9800, 10200),   # Level 0: ±2%
-            1: (9900, 10100),   # Level 1: ±1%
-            2: (9975, 10025),   # Level 2: ±0.25%
-        }
-        
         # Default NAV sanity settings
         self._default_max_jump_bps = 500  # 5%
         self._default_prev_nav_ray = 1000000000000000000000000000  # 1.0 in RAY
@@ -36,15 +50,13 @@ class SafetyProvider:
         Returns:
             Dictionary with pre-trade check results
         """
-        # Get bounds for the emergency level
-        if emergency_level in self._bounds:
-            min_bps, max_bps = self._bounds[emergency_level]
-        else:
-            # For levels >= 3, use the most restrictive bounds
-            min_bps, max_bps = self._bounds[2]
+        # Get bounds for the emergency level; unknown levels (e.g. >= 3) use
+        # the most restrictive bounds
+        level = emergency_level if 0 <= emergency_level <= _MOST_RESTRICTIVE_LEVEL else _MOST_RESTRICTIVE_LEVEL
+        min_bps, max_bps = _BOUNDS[level]
         
         # Check if price is within bounds
-        ok = 1 if min_bps <= price_bps <= max_bps else 0
+        ok = int(min_bps <= price_bps <= max_bps)
         
         return {
             "ok": ok,
@@ -86,13 +98,9 @@ class SafetyProvider:
         ok = 1  # Default to allowed
         
         if prev_nav_ray != 0 and not emergency_enabled:
-            # Calculate bounds
-            hi = prev_nav_ray * (10000 + max_jump_bps) // 10000
-            lo = prev_nav_ray * (10000 - max_jump_bps) // 10000
-            
             # Check if proposed NAV is within bounds
-            if not (lo <= proposed_nav_ray <= hi):
-                ok = 0
+            lo, hi = _nav_bounds(prev_nav_ray, max_jump_bps)
+            ok = int(lo <= proposed_nav_ray <= hi)
         
         return {
             "ok": ok,
@@ -104,13 +112,26 @@ class SafetyProvider:
         }
 
     def _load_devstack_addresses(self) -> Optional[Dict[str, str]]:
-        """Load addresses from .devstack/addresses.json if present."""
+        """Load addresses from .devstack/addresses.json if present.
+        
+        The parsed file is cached and reused until its path or mtime changes,
+        so repeat calls cost a single ``os.stat``.
+        """
+        global _ADDR_CACHE
+        devstack_path = os.path.join(os.getcwd(), ".devstack", "addresses.json")
         try:
-            devstack_path = os.path.join(os.getcwd(), ".devstack", "addresses.json")
-            if os.path.exists(devstack_path):
-                with open(devstack_path, 'r') as f:
-                    return json.load(f)
+            mtime_ns = os.stat(devstack_path).st_mtime_ns
+        except OSError:
+            return None
+        
+        cached = _ADDR_CACHE
+        if cached is not None and cached[0] == devstack_path and cached[1] == mtime_ns:
+            return cached[2]
+        
+        try:
+            with open(devstack_path, 'r') as f:
+                addresses = json.load(f)
         except Exception:
-            pass
-        return None
-
+            addresses = None
+        _ADDR_CACHE = (devstack_path, mtime_ns, addresses)
+        return addresses
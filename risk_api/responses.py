@@ -0,0 +1,46 @@
+"""
+BRICS Risk API - Response classes.
+
+Provides the default JSON response class used by all endpoints. Payloads are
+encoded with orjson, falling back to the stdlib encoder for ray-scale integers
+(e.g. ``nav_ray``, ``cap_tokens``) that exceed orjson's 64-bit integer range.
+"""
+
+import json
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def render_json(content: Any) -> bytes:
+    """Encode content as compact JSON bytes.
+    
+    Args:
+        content: JSON-serializable content
+        
+    Returns:
+        Compact UTF-8 JSON bytes
+    """
+    try:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # orjson rejects integers outside the 64-bit range
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class RiskJSONResponse(JSONResponse):
+    """JSON response encoded with orjson, with a stdlib fallback for big integers."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Render content to JSON bytes.
+        
+        Args:
+            content: JSON-serializable response content
+            
+        Returns:
+            Compact UTF-8 JSON bytes
+        """
+        return render_json(content)
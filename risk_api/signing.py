@@ -7,10 +7,18 @@ for all API responses to ensure data integrity and authenticity.
 
 import json
 import os
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
+import nacl.bindings
+import nacl.exceptions
 import nacl.signing
 
+from .orjson_compat import orjson_canonical
+
+# Number of recent (canonical payload -> signature) pairs kept per key
+SIGNATURE_CACHE_SIZE = 1024
+
 
 class SigningKey:
     """Ed25519 signing key manager for deterministic API response signing."""
@@ -26,14 +34,21 @@ class SigningKey:
         
         try:
             secret_key_bytes = bytes.fromhex(secret_key_hex)
-            self._signing_key = nacl.signing.SigningKey(secret_key_bytes)
-            self._verify_key = self._signing_key.verify_key
+            # Public key and expanded libsodium secret key (seed || public key),
+            # derived once so signing calls the binding directly
+            public_key_bytes, self._secret_key_bytes = nacl.bindings.crypto_sign_seed_keypair(secret_key_bytes)
+            self._verify_key = nacl.signing.VerifyKey(public_key_bytes)
         except Exception as e:
             raise ValueError(f"Invalid Ed25519 secret key: {e}")
+        
+        # Ed25519 is deterministic, so identical payloads (e.g. repeated requests
+        # within the same second) can reuse the previously computed signature
+        self._sign_canonical = lru_cache(maxsize=SIGNATURE_CACHE_SIZE)(self._sign_canonical_uncached)
+        self._public_key_hex = public_key_bytes.hex()
 
     def public_key_hex(self) -> str:
         """Get hex-encoded public key for verification."""
-        return self._verify_key.encode().hex()
+        return self._public_key_hex
 
     def sign(self, data: Dict[str, Any]) -> str:
         """Sign canonical JSON representation of data.
@@ -44,9 +59,36 @@ class SigningKey:
         Returns:
             Hex-encoded Ed25519 signature
         """
-        canonical_bytes = canonical_json(data)
-        signature = self._signing_key.sign(canonical_bytes)
-        return signature.signature.hex()
+        return self.sign_bytes(_canonical_json_memo(data))
+
+    def sign_bytes(self, canonical_bytes: bytes) -> str:
+        """Sign pre-serialized canonical JSON bytes.
+        
+        Args:
+            canonical_bytes: Canonical JSON bytes (see canonical_json)
+            
+        Returns:
+            Hex-encoded Ed25519 signature
+        """
+        return self._sign_canonical(canonical_bytes)
+
+    def sign_many(self, messages: List[bytes]) -> List[str]:
+        """Sign several pre-serialized canonical JSON payloads.
+        
+        Args:
+            messages: Canonical JSON bytes (see canonical_json)
+            
+        Returns:
+            Hex-encoded Ed25519 signatures, in input order
+        """
+        sign_canonical = self._sign_canonical
+        return [sign_canonical(message) for message in messages]
+
+    def _sign_canonical_uncached(self, canonical_bytes: bytes) -> str:
+        """Sign canonical JSON bytes without consulting the signature cache."""
+        # libsodium call through cffi, which releases the GIL while it runs
+        signed = nacl.bindings.crypto_sign(canonical_bytes, self._secret_key_bytes)
+        return signed[:nacl.bindings.crypto_sign_BYTES].hex()
 
     def verify(self, data: Dict[str, Any], signature_hex: str) -> bool:
         """Verify signature against canonical JSON representation.
@@ -58,13 +100,20 @@ class SigningKey:
         Returns:
             True if signature is valid, False otherwise
         """
+        # Reject malformed signatures before canonicalizing the payload
+        if not isinstance(signature_hex, str) or len(signature_hex) != 2 * nacl.bindings.crypto_sign_BYTES:
+            return False
         try:
             signature_bytes = bytes.fromhex(signature_hex)
-            canonical_bytes = canonical_json(data)
+        except ValueError:
+            return False
+        
+        canonical_bytes = _canonical_json_memo(data)
+        try:
             self._verify_key.verify(canonical_bytes, signature_bytes)
-            return True
-        except Exception:
+        except nacl.exceptions.BadSignatureError:
             return False
+        return True
 
 
 def canonical_json(obj: Dict[str, Any]) -> bytes:
@@ -82,23 +131,111 @@ def canonical_json(obj: Dict[str, Any]) -> bytes:
     Returns:
         Canonical JSON bytes
     """
-    # Ensure all values are JSON-serializable and integers
-    canonical_obj = {}
-    for key in sorted(obj.keys()):
-        value = obj[key]
-        if isinstance(value, float):
-            # Convert floats to integers (timestamps)
-            canonical_obj[key] = int(value)
-        else:
-            canonical_obj[key] = value
+    # Convert floats to integers (timestamps); payloads are normally all
+    # ints/strings, so only rebuild the dict when a float is present
+    canonical_obj = obj
+    if any(isinstance(value, float) for value in obj.values()):
+        canonical_obj = {
+            key: int(value) if isinstance(value, float) else value
+            for key, value in obj.items()
+        }
     
-    # Serialize with no whitespace and sorted keys
+    # Serialize with no whitespace and sorted keys; orjson is used only when its
+    # bytes match the stdlib form (not e.g. for ray values beyond 64 bits)
+    encoded = orjson_canonical(canonical_obj)
+    if encoded is not None:
+        return encoded
     return json.dumps(canonical_obj, separators=(',', ':'), sort_keys=True).encode('utf-8')
 
 
+@lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
+def _canonical_json_from_items(items: Tuple[Tuple[str, type, Any], ...]) -> bytes:
+    """Canonical JSON for a (key, type, value) item tuple, memoized."""
+    return canonical_json({key: value for key, _, value in items})
+
+
+def _canonical_json_memo(obj: Dict[str, Any]) -> bytes:
+    """canonical_json with repeated payloads served from a memo.
+    
+    Items are keyed with their value types so equal-but-distinct values
+    (``True``/``1``, ``1.0``/``1``) never share an entry. Keys stay in
+    insertion order rather than being sorted per call: callers build each
+    payload schema in a fixed order, and canonical_json sorts on a miss.
+    Only flat payloads are memoized: a type tag on a container would not
+    cover its elements (``(1,)``/``(True,)``, ``(0.0,)``/``(-0.0,)``), so
+    payloads with container or unhashable values are canonicalized directly.
+    """
+    items = []
+    for key, value in obj.items():
+        if isinstance(value, (dict, list, tuple)):
+            return canonical_json(obj)
+        items.append((key, value.__class__, value))
+    try:
+        return _canonical_json_from_items(tuple(items))
+    except TypeError:
+        return canonical_json(obj)
+
+
+def canonical_prefix(obj: Dict[str, Any]) -> bytes:
+    """Generate canonical JSON for a payload's static fields, left open for ts.
+    
+    All keys must sort before ``ts``; complete the payload with canonical_with_ts.
+    
+    Args:
+        obj: Payload fields excluding ts
+        
+    Returns:
+        Canonical JSON bytes without the closing brace
+    """
+    return canonical_json(obj)[:-1]
+
+
+def canonical_with_ts(prefix: bytes, ts: int) -> bytes:
+    """Complete a canonical_prefix with the trailing ts field.
+    
+    Args:
+        prefix: Bytes from canonical_prefix
+        ts: Unix timestamp in seconds
+        
+    Returns:
+        Canonical JSON bytes, identical to canonical_json of the full payload
+    """
+    return prefix + b',"ts":%d}' % ts
+
+
+def canonical_from_template(template: str, data: Dict[str, Any]) -> bytes:
+    """Render canonical JSON for a fixed-schema payload from a format template.
+    
+    Produces the same bytes as canonical_json for payloads matching the
+    template, without the generic sort/encode pass. Templates list keys in
+    sorted order with ``%(key)d`` for integers and ``%(key)s`` for strings.
+    
+    Args:
+        template: Canonical JSON format template (e.g. a model's CANON_TEMPLATE)
+        data: Dictionary providing every templated key
+        
+    Returns:
+        Canonical JSON bytes
+    """
+    values = {
+        key: json.dumps(value) if isinstance(value, str) else value
+        for key, value in data.items()
+    }
+    return (template % values).encode('utf-8')
+
+
+@lru_cache(maxsize=4)
+def _signing_key_for(secret_key_hex: str) -> SigningKey:
+    """Shared SigningKey per secret key, so its key expansion and caches are reused."""
+    return SigningKey(secret_key_hex)
+
+
 def create_signing_key() -> SigningKey:
     """Create signing key from environment variable.
     
+    Keys are shared process-wide per RISK_API_ED25519_SK_HEX value, so repeat
+    calls return the same instance while changing the variable still takes effect.
+    
     Returns:
         Initialized SigningKey instance
         
@@ -109,4 +246,4 @@ def create_signing_key() -> SigningKey:
     if not secret_key_hex:
         raise ValueError("RISK_API_ED25519_SK_HEX environment variable is required")
     
-    return SigningKey(secret_key_hex)
+    return _signing_key_for(secret_key_hex)
@@ -0,0 +1,71 @@
+"""
+BRICS Risk API - Process-wide application state.
+
+Holds the singleton data providers, the prefetched feed snapshot store, the
+signing key and batch signer that request handlers use directly, with environment configuration
+loading. Tests can swap an entry with
+``monkeypatch.setattr(state, "NAV_PROVIDER", ...)``; swapped or mutated
+providers reach the feed endpoints on the next snapshot, so call
+``SNAPSHOT_STORE.refresh()`` to publish one immediately.
+"""
+
+from functools import lru_cache
+from typing import List
+
+from dotenv import load_dotenv
+
+from .batching import BatchSigner
+from .providers import NavProvider, EmergencyProvider, IssuanceProvider, RiskProvider, SafetyProvider
+from .signing import SigningKey, create_signing_key
+from .store import FeedSnapshot, SnapshotStore
+
+
+# Load environment variables from .env file if present
+load_dotenv()
+
+# Provider singletons, created once at import (after .env is loaded)
+NAV_PROVIDER = NavProvider()
+EMERGENCY_PROVIDER = EmergencyProvider()
+ISSUANCE_PROVIDER = IssuanceProvider()
+RISK_PROVIDER = RiskProvider()
+SAFETY_PROVIDER = SafetyProvider()
+
+
+def fetch_snapshot() -> FeedSnapshot:
+    """Query the current provider singletons for a new feed snapshot."""
+    return FeedSnapshot(
+        nav=NAV_PROVIDER.get_nav_data(),
+        emergency=EMERGENCY_PROVIDER.get_emergency_data(),
+        issuance=ISSUANCE_PROVIDER.get_issuance_data(),
+        risk=RISK_PROVIDER.get_risk_data(),
+    )
+
+
+# Feed snapshot store, kept fresh by the application lifespan
+SNAPSHOT_STORE = SnapshotStore(fetch_snapshot)
+
+
+@lru_cache()
+def get_signing_key() -> SigningKey:
+    """Get cached signing key instance.
+    
+    Created on first use so the app can start (and serve unsigned endpoints)
+    before RISK_API_ED25519_SK_HEX is configured.
+    
+    Returns:
+        Initialized SigningKey instance
+        
+    Raises:
+        ValueError: If RISK_API_ED25519_SK_HEX is not set or invalid
+    """
+    return create_signing_key()
+
+
+def _sign_many(messages: List[bytes]) -> List[str]:
+    """Sign canonical payloads with the current signing key."""
+    return get_signing_key().sign_many(messages)
+
+
+# Batch signer for per-request payloads, run by the application lifespan when
+# RISK_API_SIGN_BATCH_SIZE is set (signs inline otherwise)
+BATCH_SIGNER = BatchSigner(_sign_many)
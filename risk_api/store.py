@@ -0,0 +1,93 @@
+"""
+BRICS Risk API - Prefetched feed snapshots.
+
+Holds an immutable snapshot of the NAV, emergency, issuance and risk feeds that
+a background task refreshes, so request handlers read the current snapshot
+instead of querying providers (and, once wired on-chain, RPC) per request.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .providers import EmergencyData, IssuanceData, NavData, RiskData
+
+
+@dataclass(frozen=True, slots=True)
+class FeedSnapshot:
+    """Point-in-time data from all four feed providers."""
+    nav: NavData
+    emergency: EmergencyData
+    issuance: IssuanceData
+    risk: RiskData
+
+
+class SnapshotStore:
+    """Latest feed snapshot, replaced wholesale by a background refresher."""
+
+    def __init__(self, fetch: Callable[[], FeedSnapshot]) -> None:
+        """Initialize an empty store.
+
+        Args:
+            fetch: Callable that queries the providers for a new snapshot
+        """
+        self._fetch = fetch
+        self._snapshot: Optional[FeedSnapshot] = None
+        self._refresher_running = False
+        # Serializes fetch-and-publish, so a refresh never publishes a snapshot
+        # fetched before an earlier refresh that has already been published
+        self._refresh_lock = threading.Lock()
+
+    def current(self) -> FeedSnapshot:
+        """Get the current snapshot.
+
+        Returns the prefetched snapshot while the refresher is running (so it
+        may lag the providers by up to one refresh interval), otherwise fetches
+        directly (e.g. outside the application lifespan).
+        """
+        snapshot = self._snapshot
+        if self._refresher_running and snapshot is not None:
+            return snapshot
+        return self._fetch()
+
+    def refresh(self, prepare: Optional[Callable[[FeedSnapshot], None]] = None) -> FeedSnapshot:
+        """Fetch a new snapshot and publish it.
+
+        Safe to call from any thread while the refresher runs, e.g. to make a
+        provider change visible immediately instead of after the next interval.
+
+        Args:
+            prepare: Optional hook run on the snapshot before it is published
+
+        Returns:
+            The newly published snapshot
+        """
+        with self._refresh_lock:
+            snapshot = self._fetch()
+            if prepare is not None:
+                prepare(snapshot)
+            self._snapshot = snapshot
+        return snapshot
+
+    async def run_refresher(
+        self,
+        interval_s: float,
+        prepare: Optional[Callable[[FeedSnapshot], None]] = None,
+    ) -> None:
+        """Refresh the snapshot every interval until cancelled.
+
+        Fetches (and ``prepare``) run in a worker thread so slow providers never
+        block the event loop.
+
+        Args:
+            interval_s: Seconds between refreshes
+            prepare: Optional hook run on each snapshot before it is published
+        """
+        self._refresher_running = True
+        try:
+            while True:
+                await asyncio.to_thread(self.refresh, prepare)
+                await asyncio.sleep(interval_s)
+        finally:
+            self._refresher_running = False
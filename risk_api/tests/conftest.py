@@ -4,34 +4,53 @@ BRICS Risk API - Test configuration and fixtures.
 Provides test client, ephemeral signing key, and provider overrides for testing.
 """
 
-import os
 import pytest
 from fastapi.testclient import TestClient
 
+from risk_api import state
 from risk_api.app import app
 from risk_api.signing import SigningKey
 
 
+# Deterministic test key (64 hex characters = 32 bytes)
+TEST_SECRET_KEY_HEX = "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _signing_key_env() -> None:
+    """Provide the test signing key through the environment for the whole session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("RISK_API_ED25519_SK_HEX", TEST_SECRET_KEY_HEX)
+        yield
+
+
+@pytest.fixture
+def swap_state():
+    """Swap risk_api.state entries for one test, publishing a fresh feed snapshot.
+    
+    The snapshot is republished on every swap and again after the entries are
+    restored, so neither change waits for the background refresher.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        def swap(name: str, value: object) -> None:
+            mp.setattr(state, name, value)
+            state.SNAPSHOT_STORE.refresh()
+        
+        yield swap
+    state.SNAPSHOT_STORE.refresh()
+
+
 @pytest.fixture
 def test_signing_key() -> SigningKey:
     """Create ephemeral signing key for testing."""
-    # Use a deterministic test key (64 hex characters = 32 bytes)
-    test_secret = "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f"
-    return SigningKey(test_secret)
+    return SigningKey(TEST_SECRET_KEY_HEX)
 
 
-@pytest.fixture
-def test_client(test_signing_key: SigningKey) -> TestClient:
-    """Create test client with ephemeral signing key."""
-    # Set environment variable for the test
-    os.environ["RISK_API_ED25519_SK_HEX"] = "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f"
-    
+@pytest.fixture(scope="session")
+def test_client() -> TestClient:
+    """Create one test client (and app lifespan) shared by the whole session."""
     with TestClient(app) as client:
         yield client
-    
-    # Clean up
-    if "RISK_API_ED25519_SK_HEX" in os.environ:
-        del os.environ["RISK_API_ED25519_SK_HEX"]
 
 
 @pytest.fixture
@@ -0,0 +1,91 @@
+"""
+BRICS Risk API - Batch signer tests.
+
+Tests for batched signing of per-request safety check payloads.
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from risk_api import app as app_module
+from risk_api import state
+from risk_api.batching import BatchSigner
+from risk_api.signing import SigningKey, canonical_json
+
+
+def test_batch_signer_signs_inline_when_stopped(test_signing_key: SigningKey) -> None:
+    """Test a stopped batch signer signs directly."""
+    signer = BatchSigner(test_signing_key.sign_many)
+    message = canonical_json({"ok": 1, "ts": 1640995200})
+
+    assert not signer.running
+    assert asyncio.run(signer.sign(message)) == test_signing_key.sign_bytes(message)
+
+
+def test_batch_signer_groups_concurrent_requests(test_signing_key: SigningKey) -> None:
+    """Test concurrent requests are signed in one batch, in order."""
+    calls: List[List[bytes]] = []
+
+    def sign_many(messages: List[bytes]) -> List[str]:
+        calls.append(messages)
+        return test_signing_key.sign_many(messages)
+
+    signer = BatchSigner(sign_many)
+    messages = [canonical_json({"ok": 1, "ts": ts}) for ts in range(5)]
+
+    async def scenario() -> List[str]:
+        task = asyncio.create_task(signer.run(max_batch=32, max_delay_s=0.01))
+        await asyncio.sleep(0)
+        assert signer.running
+        signatures = await asyncio.gather(*(signer.sign(message) for message in messages))
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return signatures
+
+    signatures = asyncio.run(scenario())
+
+    assert calls == [messages]
+    assert signatures == [test_signing_key.sign_bytes(message) for message in messages]
+    assert not signer.running
+
+
+def test_batch_signer_propagates_errors() -> None:
+    """Test a failing batch raises in every waiting request."""
+    def sign_many(messages: List[bytes]) -> List[str]:
+        raise ValueError("RISK_API_ED25519_SK_HEX environment variable is required")
+
+    signer = BatchSigner(sign_many)
+
+    async def scenario() -> None:
+        task = asyncio.create_task(signer.run(max_batch=2, max_delay_s=0.0))
+        await asyncio.sleep(0)
+        with pytest.raises(ValueError):
+            await signer.sign(b"{}")
+        task.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_safety_check_batched_signature_matches_inline(
+    test_signing_key: SigningKey, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test batched safety check results equal the inline-signed results."""
+    monkeypatch.setattr(state, "BATCH_SIGNER", BatchSigner(test_signing_key.sign_many))
+    args = (10000, 0, 1640995200)
+
+    async def scenario() -> dict:
+        task = asyncio.create_task(state.BATCH_SIGNER.run(max_batch=32, max_delay_s=0.0))
+        await asyncio.sleep(0)
+        result = await app_module._signed_safety_check(
+            app_module._lane_pretrade_fields, app_module._signed_lane_pretrade, *args
+        )
+        task.cancel()
+        return result
+
+    batched = asyncio.run(scenario())
+
+    assert batched == app_module._signed_lane_pretrade(*args)
+    assert list(batched) == list(app_module._signed_lane_pretrade(*args))
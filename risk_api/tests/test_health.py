@@ -4,9 +4,13 @@ BRICS Risk API - Health endpoint tests.
 Tests for the health check endpoint.
 """
 
+import time
+
 import pytest
 from fastapi.testclient import TestClient
 
+from risk_api.signing import SigningKey
+
 
 def test_health_check(test_client: TestClient) -> None:
     """Test health check endpoint returns correct status."""
@@ -36,3 +40,21 @@ def test_health_check_schema(test_client: TestClient) -> None:
     # Check field types
     assert isinstance(data["status"], str)
     assert isinstance(data["ts"], int)
+
+
+def test_health_check_ts_is_current(test_client: TestClient) -> None:
+    """Test cached clock timestamp tracks the system clock."""
+    response = test_client.get("/api/v1/health")
+    
+    assert response.status_code == 200
+    assert abs(response.json()["ts"] - int(time.time())) <= 1
+
+
+def test_public_key(test_client: TestClient, test_signing_key: SigningKey) -> None:
+    """Test well-known public key endpoint returns the signing key's public key."""
+    for _ in range(2):  # second request is served from the cached body
+        response = test_client.get("/.well-known/risk-api-pubkey")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"ed25519_pubkey_hex": test_signing_key.public_key_hex()}
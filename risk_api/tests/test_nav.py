@@ -7,6 +7,8 @@ Tests for the NAV latest endpoint with signature verification.
 import pytest
 from fastapi.testclient import TestClient
 
+from risk_api.providers import NavProvider
+from risk_api.providers import nav as nav_module
 from risk_api.signing import SigningKey
 
 
@@ -73,3 +75,50 @@ def test_nav_latest_schema(test_client: TestClient) -> None:
     assert isinstance(data["emergency_enabled"], int)
     assert isinstance(data["ts"], int)
     assert isinstance(data["sig"], str)
+
+
+def test_nav_latest_uses_state_provider(
+    test_client: TestClient, test_signing_key: SigningKey, swap_state
+) -> None:
+    """Test NAV latest reads the provider singleton from risk_api.state."""
+    provider = NavProvider()
+    provider._set_nav_ray(1050000000000000000000000000)
+    swap_state("NAV_PROVIDER", provider)
+    
+    response = test_client.get("/api/v1/nav/latest")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["nav_ray"] == 1050000000000000000000000000
+    
+    nav_data = {key: data[key] for key in ["nav_ray", "model_hash", "emergency_nav_ray", "emergency_enabled", "ts"]}
+    assert test_signing_key.verify(nav_data, data["sig"])
+
+
+def test_nav_latest_gzip_compressed(test_client: TestClient, test_signing_key: SigningKey) -> None:
+    """Test NAV latest is gzip-compressed on request and still verifies."""
+    response = test_client.get("/api/v1/nav/latest", headers={"Accept-Encoding": "gzip"})
+    
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    data = response.json()
+    
+    nav_data = {key: data[key] for key in ["nav_ray", "model_hash", "emergency_nav_ray", "emergency_enabled", "ts"]}
+    assert test_signing_key.verify(nav_data, data["sig"])
+
+
+def test_nav_provider_config_loaded_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test NAV provider env config is memoized until the cache is cleared."""
+    nav_module._load_config.cache_clear()
+    monkeypatch.setenv("NAV_RAY", "1010000000000000000000000000")
+    assert NavProvider().get_nav_data().nav_ray == 1010000000000000000000000000
+    
+    # Cached: later env changes are not re-parsed
+    monkeypatch.setenv("NAV_RAY", "1020000000000000000000000000")
+    assert NavProvider().get_nav_data().nav_ray == 1010000000000000000000000000
+    
+    nav_module._load_config.cache_clear()
+    assert NavProvider().get_nav_data().nav_ray == 1020000000000000000000000000
+    
+    monkeypatch.delenv("NAV_RAY")
+    nav_module._load_config.cache_clear()
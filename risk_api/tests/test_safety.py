@@ -4,10 +4,32 @@ BRICS Risk API - Safety endpoint tests.
 Tests for the lane pre-trade check and NAV sanity check endpoints.
 """
 
+import asyncio
+import os
+from typing import Any, Dict, List, Sequence
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
+from risk_api import app as app_module
+from risk_api.providers import SafetyProvider
 from risk_api.signing import SigningKey
+from risk_api.verify_signature import NAV_SANITY_FIELDS, PRETRADE_FIELDS
+
+RAY = 10**27
+
+
+def _get_all(urls: Sequence[str]) -> List[Dict[str, Any]]:
+    """GET every URL concurrently against the in-process app and return the JSON bodies."""
+    async def fetch() -> List[httpx.Response]:
+        transport = httpx.ASGITransport(app=app_module.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*(client.get(url) for url in urls))
+    
+    responses = asyncio.run(fetch())
+    assert [response.status_code for response in responses] == [200] * len(urls)
+    return [response.json() for response in responses]
 
 
 def test_lane_pretrade_response(test_client: TestClient) -> None:
@@ -49,74 +71,44 @@ def test_lane_pretrade_signature_verification(test_client: TestClient, test_sign
     data = response.json()
     
     # Extract data without signature for verification
-    pretrade_data = {
-        "ok": data["ok"],
-        "min_bps": data["min_bps"],
-        "max_bps": data["max_bps"],
-        "price_bps": data["price_bps"],
-        "emergency_level": data["emergency_level"],
-        "ts": data["ts"],
-    }
+    pretrade_data = {key: data[key] for key in PRETRADE_FIELDS}
     
     # Verify signature
     assert test_signing_key.verify(pretrade_data, data["sig"])
 
 
-def test_lane_pretrade_level_0_bounds(test_client: TestClient) -> None:
-    """Test lane pre-trade with level 0 bounds (9800-10200)."""
-    # Test within bounds
-    response = test_client.get("/api/v1/lane/pretrade?price_bps=10000&emergency_level=0")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["ok"] == 1
-    assert data["min_bps"] == 9800
-    assert data["max_bps"] == 10200
-    
-    # Test below bounds
-    response = test_client.get("/api/v1/lane/pretrade?price_bps=9700&emergency_level=0")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["ok"] == 0
+@pytest.mark.parametrize(
+    "level, min_bps, max_bps, prices, expected",
+    [
+        (0, 9800, 10200, (10000, 9800, 10200, 9700, 10300), (1, 1, 1, 0, 0)),   # ±2%
+        (1, 9900, 10100, (10000, 9900, 10100, 9899, 10200), (1, 1, 1, 0, 0)),   # ±1%
+        (2, 9975, 10025, (10000, 9975, 10025, 9974, 10050), (1, 1, 1, 0, 0)),   # ±0.25%
+    ],
+)
+def test_lane_pretrade_bounds(
+    level: int,
+    min_bps: int,
+    max_bps: int,
+    prices: tuple,
+    expected: tuple,
+) -> None:
+    """Test lane pre-trade bounds for each emergency level (all probes issued concurrently)."""
+    results = _get_all([f"/api/v1/lane/pretrade?price_bps={price}&emergency_level={level}" for price in prices])
     
-    # Test above bounds
-    response = test_client.get("/api/v1/lane/pretrade?price_bps=10300&emergency_level=0")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["ok"] == 0
+    assert [data["ok"] for data in results] == list(expected)
+    assert {(data["min_bps"], data["max_bps"]) for data in results} == {(min_bps, max_bps)}
 
 
-def test_lane_pretrade_level_1_bounds(test_client: TestClient) -> None:
-    """Test lane pre-trade with level 1 bounds (9900-10100)."""
-    # Test within bounds
-    response = test_client.get("/api/v1/lane/pretrade?price_bps=10000&emergency_level=1")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["ok"] == 1
-    assert data["min_bps"] == 9900
-    assert data["max_bps"] == 10100
-    
-    # Test outside bounds
-    response = test_client.get("/api/v1/lane/pretrade?price_bps=10200&emergency_level=1")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["ok"] == 0
-
-
-def test_lane_pretrade_level_2_bounds(test_client: TestClient) -> None:
-    """Test lane pre-trade with level 2 bounds (9975-10025)."""
-    # Test within bounds
-    response = test_client.get("/api/v1/lane/pretrade?price_bps=10000&emergency_level=2")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["ok"] == 1
-    assert data["min_bps"] == 9975
-    assert data["max_bps"] == 10025
-    
-    # Test outside bounds
-    response = test_client.get("/api/v1/lane/pretrade?price_bps=10050&emergency_level=2")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["ok"] == 0
+def test_lane_pretrade_unknown_level_uses_most_restrictive_bounds(test_client: TestClient) -> None:
+    """Test lane pre-trade with unknown levels falls back to level 2 bounds."""
+    for level in (3, 7, -1):
+        response = test_client.get(f"/api/v1/lane/pretrade?price_bps=10000&emergency_level={level}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ok"] == 1
+        assert data["min_bps"] == 9975
+        assert data["max_bps"] == 10025
+        assert data["emergency_level"] == level
 
 
 def test_nav_sanity_response(test_client: TestClient) -> None:
@@ -160,42 +152,42 @@ def test_nav_sanity_signature_verification(test_client: TestClient, test_signing
     data = response.json()
     
     # Extract data without signature for verification
-    nav_sanity_data = {
-        "ok": data["ok"],
-        "prev_nav_ray": data["prev_nav_ray"],
-        "proposed_nav_ray": data["proposed_nav_ray"],
-        "max_jump_bps": data["max_jump_bps"],
-        "emergency_enabled": data["emergency_enabled"],
-        "assumed_prev": data["assumed_prev"],
-        "ts": data["ts"],
-    }
+    nav_sanity_data = {key: data[key] for key in NAV_SANITY_FIELDS}
     
     # Verify signature
     assert test_signing_key.verify(nav_sanity_data, data["sig"])
 
 
-def test_nav_sanity_within_bounds(test_client: TestClient) -> None:
-    """Test NAV sanity with price within bounds."""
-    prev_nav = 1000000000000000000000000000  # 1.0 RAY
-    proposed_nav = 1020000000000000000000000000  # 1.02 RAY (2% increase)
+@pytest.mark.parametrize(
+    "proposed_nav, max_jump_bps, expected_ok",
+    [
+        (102 * RAY // 100, 500, 1),   # 2% increase within default 5%
+        (110 * RAY // 100, 500, 0),   # 10% increase outside 5%
+        (103 * RAY // 100, 500, 1),   # 3% increase within 5%
+        (103 * RAY // 100, 200, 0),   # 3% increase outside custom 2%
+    ],
+)
+def test_nav_sanity_bounds(proposed_nav: int, max_jump_bps: int, expected_ok: int) -> None:
+    """Test NAV sanity bounds against an explicit previous NAV."""
+    [data] = _get_all([
+        f"/api/v1/oracle/nav-sanity?prev_nav_ray={RAY}&proposed_nav_ray={proposed_nav}&max_jump_bps={max_jump_bps}",
+    ])
     
-    response = test_client.get(f"/api/v1/oracle/nav-sanity?prev_nav_ray={prev_nav}&proposed_nav_ray={proposed_nav}&max_jump_bps=500")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["ok"] == 1
+    assert data["ok"] == expected_ok
     assert data["assumed_prev"] == 0
+    assert data["max_jump_bps"] == max_jump_bps
 
 
-def test_nav_sanity_outside_bounds(test_client: TestClient) -> None:
-    """Test NAV sanity with price outside bounds."""
-    prev_nav = 1000000000000000000000000000  # 1.0 RAY
-    proposed_nav = 1100000000000000000000000000  # 1.10 RAY (10% increase)
+def test_nav_sanity_default_max_jump() -> None:
+    """Test omitting max_jump_bps applies the 500 bps default (all probes issued concurrently)."""
+    proposed_navs = (102 * RAY // 100, 105 * RAY // 100, 95 * RAY // 100, 106 * RAY // 100, 110 * RAY // 100)
+    results = _get_all([
+        f"/api/v1/oracle/nav-sanity?prev_nav_ray={RAY}&proposed_nav_ray={proposed_nav}"
+        for proposed_nav in proposed_navs
+    ])
     
-    response = test_client.get(f"/api/v1/oracle/nav-sanity?prev_nav_ray={prev_nav}&proposed_nav_ray={proposed_nav}&max_jump_bps=500")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["ok"] == 0
-    assert data["assumed_prev"] == 0
+    assert [data["max_jump_bps"] for data in results] == [500] * len(proposed_navs)
+    assert [data["ok"] for data in results] == [1, 1, 1, 0, 0]
 
 
 def test_nav_sanity_emergency_enabled(test_client: TestClient) -> None:
@@ -238,3 +230,35 @@ def test_nav_sanity_custom_max_jump(test_client: TestClient) -> None:
     data = response.json()
     assert data["ok"] == 0
 
+
+def test_devstack_addresses_cached_until_modified(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test devstack addresses are re-read only when the file changes."""
+    monkeypatch.chdir(tmp_path)
+    provider = SafetyProvider()
+    assert provider._load_devstack_addresses() is None
+    
+    addresses_path = tmp_path / ".devstack" / "addresses.json"
+    addresses_path.parent.mkdir()
+    addresses_path.write_text('{"lane": "0x01"}')
+    first = provider._load_devstack_addresses()
+    assert first == {"lane": "0x01"}
+    assert provider._load_devstack_addresses() is first
+    
+    addresses_path.write_text('{"lane": "0x02"}')
+    stat = addresses_path.stat()
+    os.utime(addresses_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert provider._load_devstack_addresses() == {"lane": "0x02"}
+
+
+def test_lane_pretrade_signed_result_reused_within_second(
+    test_client: TestClient, test_signing_key: SigningKey
+) -> None:
+    """Test repeat pre-trade checks in the same second share one signed result."""
+    first = app_module._signed_lane_pretrade(10000, 0, 1640995200)
+    
+    assert app_module._signed_lane_pretrade(10000, 0, 1640995200) is first
+    later = app_module._signed_lane_pretrade(10000, 0, 1640995201)
+    assert later["ts"] == 1640995201
+    
+    pretrade_data = {key: value for key, value in later.items() if key != "sig"}
+    assert test_signing_key.verify(pretrade_data, later["sig"])
@@ -0,0 +1,213 @@
+"""
+BRICS Risk API - Signing tests.
+
+Tests for canonical JSON serialization and Ed25519 signing key behaviour.
+"""
+
+import dataclasses
+import datetime
+import enum
+import json
+import uuid
+from dataclasses import fields
+
+import nacl.signing
+import pytest
+
+from risk_api.models import LanePretradeResponse, NavSanityResponse
+from risk_api.providers import EmergencyProvider, IssuanceProvider, NavProvider, RiskProvider
+from risk_api.signing import (
+    SigningKey,
+    _canonical_json_memo,
+    canonical_from_template,
+    canonical_json,
+    canonical_with_ts,
+    create_signing_key,
+)
+
+
+def test_sign_is_deterministic(test_signing_key: SigningKey, sample_nav_data: dict) -> None:
+    """Test identical payloads produce identical signatures."""
+    sig1 = test_signing_key.sign(sample_nav_data)
+    sig2 = test_signing_key.sign(dict(sample_nav_data))
+    
+    assert sig1 == sig2
+    assert len(sig1) == 128  # Ed25519 signature hex length
+    assert test_signing_key.verify(sample_nav_data, sig1)
+
+
+def test_sign_matches_pynacl(test_signing_key: SigningKey, sample_issuance_data: dict) -> None:
+    """Test signatures match the reference PyNaCl signing key."""
+    test_secret = "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f"
+    reference = nacl.signing.SigningKey(bytes.fromhex(test_secret))
+    expected = reference.sign(canonical_json(sample_issuance_data)).signature.hex()
+    
+    assert test_signing_key.sign(sample_issuance_data) == expected
+
+
+def test_sign_reuses_cached_signature(test_signing_key: SigningKey, sample_risk_data: dict) -> None:
+    """Test repeated payloads are served from the signature cache."""
+    test_signing_key.sign(sample_risk_data)
+    test_signing_key.sign(sample_risk_data)
+    
+    info = test_signing_key._sign_canonical.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_canonical_memo_keys_on_value_type(test_signing_key: SigningKey) -> None:
+    """Test the canonical JSON memo never conflates equal values of different types."""
+    assert _canonical_json_memo({"ok": 1, "ts": 5}) == b'{"ok":1,"ts":5}'
+    assert _canonical_json_memo({"ok": True, "ts": 5}) == b'{"ok":true,"ts":5}'
+    assert _canonical_json_memo({"ok": 1.0, "ts": 5}) == canonical_json({"ok": 1.0, "ts": 5})
+    
+    # Unhashable values bypass the memo
+    assert _canonical_json_memo({"ids": [1, 2], "ts": 5}) == canonical_json({"ids": [1, 2], "ts": 5})
+    
+    # So do containers, whose elements the type tag would not cover
+    for first, second in (((1,), (True,)), ((0.0,), (-0.0,)), ({"a": 1}, {"a": 1.0})):
+        for value in (first, second):
+            payload = {"ids": value, "ts": 5}
+            assert _canonical_json_memo(payload) == canonical_json(payload)
+    
+    signature = test_signing_key.sign({"ok": True, "ts": 5})
+    assert test_signing_key.verify({"ok": True, "ts": 5}, signature)
+    assert not test_signing_key.verify({"ok": 1, "ts": 5}, signature)
+
+
+def test_sign_changes_with_timestamp(test_signing_key: SigningKey, sample_risk_data: dict) -> None:
+    """Test a new timestamp produces a fresh signature."""
+    later = dict(sample_risk_data, ts=sample_risk_data["ts"] + 1)
+    
+    sig1 = test_signing_key.sign(sample_risk_data)
+    sig2 = test_signing_key.sign(later)
+    
+    assert sig1 != sig2
+    assert test_signing_key.verify(later, sig2)
+    assert not test_signing_key.verify(sample_risk_data, sig2)
+
+
+def test_canonical_json_sorted_compact(sample_emergency_data: dict) -> None:
+    """Test canonical JSON uses sorted keys and no whitespace."""
+    assert canonical_json(sample_emergency_data) == b'{"level":0,"reason":"normal","ts":1640995200}'
+
+
+@pytest.mark.parametrize("payload", [
+    {"b": 2, "a": 1, "ts": 1640995200.9},
+    {"cap_tokens": 4440000000000000000000000, "locked": 0, "ts": 1640995200},
+    {"reason": 'caf\u00e9 "quoted"\n', "level": 1, "ts": 1640995200},
+    {"nested": {"z": 1, "a": [1, 2]}, "ok": True, "note": None},
+    {"reason": "del\x7f", "level": 1, "ts": 1640995200},
+    {"nested": {"tiny": 1e-05, "huge": 1e+20, "nan": float("nan")}, "ts": 1640995200},
+])
+def test_canonical_json_matches_stdlib(payload: dict) -> None:
+    """Test orjson-backed canonical JSON is byte-identical to the stdlib form."""
+    expected_obj = {k: int(v) if isinstance(v, float) else v for k, v in payload.items()}
+    expected = json.dumps(expected_obj, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    assert canonical_json(payload) == expected
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+@pytest.mark.parametrize("value", [
+    datetime.datetime(2020, 1, 1),
+    datetime.date(2020, 1, 1),
+    _Point(1),
+    uuid.UUID(int=1),
+    _Color.RED,
+    [uuid.UUID(int=1)],
+])
+def test_canonical_json_rejects_non_json_types(value: object) -> None:
+    """Test values json.dumps rejects raise instead of being signed via orjson."""
+    with pytest.raises(TypeError):
+        canonical_json({"value": value, "ts": 1640995200})
+
+
+@pytest.mark.parametrize(
+    "provider_cls, getter",
+    [
+        (NavProvider, "get_nav_data"),
+        (EmergencyProvider, "get_emergency_data"),
+        (IssuanceProvider, "get_issuance_data"),
+        (RiskProvider, "get_risk_data"),
+    ],
+)
+def test_provider_canon_prefix_matches_canonical_json(provider_cls, getter: str) -> None:
+    """Test provider canonical prefixes complete to the same bytes as canonical_json."""
+    data = getattr(provider_cls(), getter)()
+    payload = {f.name: getattr(data, f.name) for f in fields(data) if f.name != "canon_prefix"}
+    
+    assert canonical_with_ts(data.canon_prefix, data.ts) == canonical_json(payload)
+
+
+def test_safety_canon_templates_match_canonical_json() -> None:
+    """Test safety response CANON_TEMPLATEs render the same bytes as canonical_json."""
+    pretrade_data = {
+        "ok": 1,
+        "min_bps": 9800,
+        "max_bps": 10200,
+        "price_bps": 10000,
+        "emergency_level": 0,
+        "ts": 1640995200,
+    }
+    nav_sanity_data = {
+        "ok": 0,
+        "prev_nav_ray": 1000000000000000000000000000,
+        "proposed_nav_ray": 1100000000000000000000000000,
+        "max_jump_bps": 500,
+        "emergency_enabled": 0,
+        "assumed_prev": 0,
+        "ts": 1640995200,
+    }
+    
+    assert canonical_from_template(LanePretradeResponse.CANON_TEMPLATE, pretrade_data) == canonical_json(pretrade_data)
+    assert canonical_from_template(NavSanityResponse.CANON_TEMPLATE, nav_sanity_data) == canonical_json(nav_sanity_data)
+
+
+def test_canon_prefix_escapes_strings() -> None:
+    """Test string fields are JSON-escaped exactly like canonical_json."""
+    provider = EmergencyProvider()
+    provider._set_reason('say "hi"\\n é')
+    data = provider.get_emergency_data()
+    
+    expected = canonical_json({"level": data.level, "reason": data.reason, "ts": data.ts})
+    assert canonical_with_ts(data.canon_prefix, data.ts) == expected
+
+
+@pytest.mark.parametrize("bad_signature", ["", "zz" * 64, "ab" * 63, None])
+def test_verify_rejects_malformed_signatures(
+    test_signing_key: SigningKey, sample_risk_data: dict, bad_signature
+) -> None:
+    """Test malformed signatures are rejected without raising."""
+    assert not test_signing_key.verify(sample_risk_data, bad_signature)
+
+
+def test_create_signing_key_shared_per_secret(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test create_signing_key reuses one instance per secret key value."""
+    monkeypatch.setenv("RISK_API_ED25519_SK_HEX", "11" * 32)
+    first = create_signing_key()
+    assert create_signing_key() is first
+    
+    monkeypatch.setenv("RISK_API_ED25519_SK_HEX", "22" * 32)
+    second = create_signing_key()
+    assert second is not first
+    assert second.public_key_hex() == SigningKey("22" * 32).public_key_hex()
+    
+    monkeypatch.delenv("RISK_API_ED25519_SK_HEX")
+    with pytest.raises(ValueError):
+        create_signing_key()
+
+
+def test_canonical_memo_independent_of_key_order(test_signing_key: SigningKey, sample_nav_data: dict) -> None:
+    """Test payloads built in different key orders canonicalize and sign identically."""
+    reordered = dict(reversed(list(sample_nav_data.items())))
+    
+    assert _canonical_json_memo(reordered) == canonical_json(sample_nav_data)
+    assert test_signing_key.sign(reordered) == test_signing_key.sign(sample_nav_data)
@@ -0,0 +1,180 @@
+"""
+BRICS Risk API - Snapshot endpoint tests.
+
+Tests for the combined feed snapshot with per-section signature verification.
+"""
+
+import asyncio
+import dataclasses
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from risk_api import app as app_module
+from risk_api import state
+from risk_api.signing import SigningKey
+from risk_api.store import FeedSnapshot, SnapshotStore
+
+
+SECTION_ENDPOINTS = {
+    "nav": "/api/v1/nav/latest",
+    "emergency": "/api/v1/emergency/level",
+    "issuance": "/api/v1/issuance/state",
+    "risk": "/api/v1/risk/summary",
+}
+
+
+def test_snapshot_response(test_client: TestClient) -> None:
+    """Test snapshot endpoint returns all four signed sections."""
+    response = test_client.get("/api/v1/snapshot")
+    
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert set(data) == set(SECTION_ENDPOINTS)
+    for section in data.values():
+        assert isinstance(section["ts"], int)
+        assert len(section["sig"]) == 128  # Ed25519 signature hex length
+
+
+@pytest.mark.parametrize("section", sorted(SECTION_ENDPOINTS))
+def test_snapshot_section_signature_verification(
+    test_client: TestClient, test_signing_key: SigningKey, section: str
+) -> None:
+    """Test each snapshot section verifies like its standalone endpoint."""
+    response = test_client.get("/api/v1/snapshot")
+    
+    assert response.status_code == 200
+    payload = dict(response.json()[section])
+    signature = payload.pop("sig")
+    
+    assert test_signing_key.verify(payload, signature)
+    
+    # Same fields as the standalone endpoint
+    standalone = test_client.get(SECTION_ENDPOINTS[section]).json()
+    assert set(standalone) == set(payload) | {"sig"}
+
+
+def test_snapshot_stream(
+    test_client: TestClient, test_signing_key: SigningKey, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test snapshot stream emits signed NDJSON events."""
+    monkeypatch.setattr(app_module, "STREAM_INTERVAL_S", 0.0)
+    
+    with test_client.stream("GET", "/api/v1/risk/stream", params={"max_events": 2}) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [line for line in response.iter_lines() if line]
+    
+    assert len(lines) == 2
+    for line in lines:
+        event = json.loads(line)
+        assert set(event) == set(SECTION_ENDPOINTS)
+        for section in event.values():
+            signature = section.pop("sig")
+            assert test_signing_key.verify(section, signature)
+
+
+def test_snapshot_stream_not_buffered_by_gzip(
+    test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a gzip-accepting client still receives each stream event as it is sent."""
+    monkeypatch.setattr(app_module, "STREAM_INTERVAL_S", 0.0)
+    messages = []
+    requested = []
+    
+    async def receive() -> dict:
+        if not requested:
+            requested.append(True)
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()  # never disconnect; cancelled when the stream ends
+    
+    async def send(message: dict) -> None:
+        messages.append(message)
+    
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": app_module.STREAM_PATH,
+        "raw_path": app_module.STREAM_PATH.encode(), "root_path": "",
+        "query_string": b"max_events=3", "client": ("test", 1), "server": ("test", 80),
+        "headers": [(b"host", b"test"), (b"accept-encoding", b"gzip")],
+    }
+    asyncio.run(app_module.app(scope, receive, send))
+    
+    start = messages[0]
+    assert start["type"] == "http.response.start"
+    assert b"content-encoding" not in dict(start["headers"])
+    bodies = [m["body"] for m in messages[1:] if m.get("body")]
+    assert len(bodies) == 3
+    for body in bodies:
+        assert body.endswith(b"\n")
+        assert set(json.loads(body)) == set(SECTION_ENDPOINTS)
+
+
+def test_snapshot_store_serves_prefetched_snapshot() -> None:
+    """Test a running store serves its prefetched snapshot until the next refresh."""
+    fetches = []
+    
+    def fetch() -> FeedSnapshot:
+        fetches.append(1)
+        return state.fetch_snapshot()
+    
+    store = SnapshotStore(fetch)
+    
+    # Not running: every read fetches fresh data
+    store.current()
+    store.current()
+    assert len(fetches) == 2
+    
+    async def scenario() -> None:
+        task = asyncio.create_task(store.run_refresher(60.0))
+        while store._snapshot is None:
+            await asyncio.sleep(0.01)
+        first = store.current()
+        assert store.current() is first
+        assert len(fetches) == 3
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    
+    asyncio.run(scenario())
+    
+    # Stopped: reads fall back to fetching directly
+    store.current()
+    assert len(fetches) == 4
+
+
+def test_presigned_snapshot_hits_signature_cache(test_client: TestClient) -> None:
+    """Test handlers reuse signatures computed by the snapshot presign hook."""
+    snapshot = state.fetch_snapshot()
+    app_module._presign_snapshot(snapshot)
+    
+    cache_info = state.get_signing_key()._sign_canonical.cache_info
+    misses = cache_info().misses
+    app_module._signed_nav_latest(snapshot.nav)
+    app_module._signed_risk_summary(snapshot.risk)
+    
+    assert cache_info().misses == misses
+
+
+def test_signed_payload_built_once_per_snapshot(test_client: TestClient) -> None:
+    """Test each immutable snapshot's signed payload is built once and reused."""
+    snapshot = state.fetch_snapshot()
+    payload = app_module._signed_risk_summary(snapshot.risk)
+    
+    assert app_module._signed_risk_summary(snapshot.risk) is payload
+    
+    later = dataclasses.replace(snapshot.risk, ts=snapshot.risk.ts + 1)
+    later_payload = app_module._signed_risk_summary(later)
+    assert later_payload["ts"] == snapshot.risk.ts + 1
+    assert later_payload["sig"] != payload["sig"]
+
+
+def test_signed_body_rendered_once_per_snapshot(test_client: TestClient) -> None:
+    """Test feed bodies are encoded once per snapshot and match the payload."""
+    snapshot = state.fetch_snapshot()
+    body = app_module._signed_body(app_module._signed_nav_latest, snapshot.nav)
+    
+    assert app_module._signed_body(app_module._signed_nav_latest, snapshot.nav) is body
+    assert json.loads(body) == app_module._signed_nav_latest(snapshot.nav)
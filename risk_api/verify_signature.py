@@ -5,39 +5,94 @@ BRICS Risk API - Signature verification example.
 Demonstrates how to verify Ed25519 signatures from the API responses.
 """
 
+import asyncio
 import json
 import sys
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
-import requests
+import httpx
 from nacl.signing import VerifyKey
 
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+    _HTTP2 = True
+except ImportError:  # h2 is optional; httpx falls back to HTTP/1.1 keep-alive
+    _HTTP2 = False
 
-def verify_signature(data: Dict[str, Any], signature_hex: str, public_key_hex: str) -> bool:
+try:
+    from .orjson_compat import orjson_canonical
+except ImportError:
+    # Allow running as script
+    from orjson_compat import orjson_canonical
+
+
+# Signed fields of each verified endpoint (response minus "sig"), already in
+# canonical (sorted) order so fixed-schema payloads skip the key sort
+NAV_FIELDS = ("emergency_enabled", "emergency_nav_ray", "model_hash", "nav_ray", "ts")
+RISK_FIELDS = ("correlation_bps", "defaults_bps", "sovereign_usage_bps", "ts")
+PRETRADE_FIELDS = ("emergency_level", "max_bps", "min_bps", "ok", "price_bps", "ts")
+NAV_SANITY_FIELDS = (
+    "assumed_prev", "emergency_enabled", "max_jump_bps", "ok",
+    "prev_nav_ray", "proposed_nav_ray", "ts",
+)
+
+
+@lru_cache(maxsize=64)
+def _get_verify_key(public_key_hex: str) -> VerifyKey:
+    """Decode a hex public key once and reuse it for later verifications."""
+    return VerifyKey(bytes.fromhex(public_key_hex))
+
+
+def _canonical_bytes(data: Dict[str, Any]) -> bytes:
+    """Create canonical JSON (same as in signing.py)."""
+    canonical_obj = {k: (int(v) if isinstance(v, float) else v) for k, v in data.items()}
+    
+    encoded = orjson_canonical(canonical_obj)
+    if encoded is not None:
+        return encoded
+    return json.dumps(canonical_obj, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def _canonical_fields(data: Dict[str, Any], fields: Tuple[str, ...]) -> bytes:
+    """Canonical JSON of just ``fields`` of ``data`` (``fields`` must be sorted)."""
+    canonical_obj = {}
+    for k in fields:
+        v = data[k]
+        canonical_obj[k] = int(v) if isinstance(v, float) else v
+    encoded = orjson_canonical(canonical_obj, sort_keys=False)
+    if encoded is not None:
+        return encoded
+    return json.dumps(canonical_obj, separators=(',', ':')).encode('utf-8')
+
+
+def verify_signature(
+    data: Dict[str, Any],
+    signature_hex: str,
+    public_key_hex: str,
+    fields: Optional[Tuple[str, ...]] = None,
+) -> bool:
     """Verify Ed25519 signature of canonical JSON data.
     
     Args:
-        data: Data dictionary (without signature)
+        data: Data dictionary (without signature, unless ``fields`` is given)
         signature_hex: Hex-encoded signature
         public_key_hex: Hex-encoded public key
+        fields: Optional sorted signed-field tuple (e.g. ``NAV_FIELDS``); only
+            these keys of ``data`` are canonicalized
         
     Returns:
         True if signature is valid, False otherwise
     """
     try:
-        # Create verify key
-        verify_key = VerifyKey(bytes.fromhex(public_key_hex))
+        # Get (cached) verify key
+        verify_key = _get_verify_key(public_key_hex)
         
         # Create canonical JSON (same as in signing.py)
-        canonical_obj = {}
-        for key in sorted(data.keys()):
-            value = data[key]
-            if isinstance(value, float):
-                canonical_obj[key] = int(value)
-            else:
-                canonical_obj[key] = value
-        
-        canonical_bytes = json.dumps(canonical_obj, separators=(',', ':'), sort_keys=True).encode('utf-8')
+        if fields is None:
+            canonical_bytes = _canonical_bytes(data)
+        else:
+            canonical_bytes = _canonical_fields(data, fields)
         
         # Verify signature
         signature_bytes = bytes.fromhex(signature_hex)
@@ -48,71 +103,48 @@ def verify_signature(data: Dict[str, Any], signature_hex: str, public_key_hex: s
         return False
 
 
-def main():
-    """Main function to demonstrate signature verification."""
-    base_url = "http://localhost:8000"
+async def _fetch_signed_responses(base_url: str) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+    """Fetch the public key, then the NAV and risk responses concurrently.
     
-    # Get public key
-    try:
-        pubkey_response = requests.get(f"{base_url}/.well-known/risk-api-pubkey")
+    One pooled keep-alive client serves all three requests (HTTP/2 when the
+    optional ``h2`` package is installed and the server negotiates it over TLS).
+    """
+    async with httpx.AsyncClient(base_url=base_url, http2=_HTTP2) as client:
+        pubkey_response = await client.get("/.well-known/risk-api-pubkey")
         pubkey_response.raise_for_status()
         public_key = pubkey_response.json()["ed25519_pubkey_hex"]
         print(f"Public key: {public_key}")
-    except Exception as e:
-        print(f"Failed to get public key: {e}")
-        return 1
-    
-    # Test NAV endpoint
-    try:
-        nav_response = requests.get(f"{base_url}/api/v1/nav/latest")
-        nav_response.raise_for_status()
-        nav_data = nav_response.json()
         
-        print(f"\nNAV Response:")
-        print(json.dumps(nav_data, indent=2))
-        
-        # Extract data without signature
-        nav_data_unsigned = {
-            "nav_ray": nav_data["nav_ray"],
-            "model_hash": nav_data["model_hash"],
-            "emergency_nav_ray": nav_data["emergency_nav_ray"],
-            "emergency_enabled": nav_data["emergency_enabled"],
-            "ts": nav_data["ts"],
-        }
-        
-        # Verify signature
-        is_valid = verify_signature(nav_data_unsigned, nav_data["sig"], public_key)
-        print(f"\nSignature verification: {'✓ VALID' if is_valid else '✗ INVALID'}")
-        
-    except Exception as e:
-        print(f"Failed to test NAV endpoint: {e}")
-        return 1
+        nav_response, risk_response = await asyncio.gather(
+            client.get("/api/v1/nav/latest"),
+            client.get("/api/v1/risk/summary"),
+        )
+        nav_response.raise_for_status()
+        risk_response.raise_for_status()
+        return public_key, nav_response.json(), risk_response.json()
+
+
+def main():
+    """Main function to demonstrate signature verification."""
+    base_url = "http://localhost:8000"
     
-    # Test Risk endpoint
     try:
-        risk_response = requests.get(f"{base_url}/api/v1/risk/summary")
-        risk_response.raise_for_status()
-        risk_data = risk_response.json()
-        
-        print(f"\nRisk Response:")
-        print(json.dumps(risk_data, indent=2))
-        
-        # Extract data without signature
-        risk_data_unsigned = {
-            "defaults_bps": risk_data["defaults_bps"],
-            "sovereign_usage_bps": risk_data["sovereign_usage_bps"],
-            "correlation_bps": risk_data["correlation_bps"],
-            "ts": risk_data["ts"],
-        }
-        
-        # Verify signature
-        is_valid = verify_signature(risk_data_unsigned, risk_data["sig"], public_key)
-        print(f"\nSignature verification: {'✓ VALID' if is_valid else '✗ INVALID'}")
-        
+        public_key, nav_data, risk_data = asyncio.run(_fetch_signed_responses(base_url))
     except Exception as e:
-        print(f"Failed to test Risk endpoint: {e}")
+        print(f"Failed to fetch signed responses: {e}")
         return 1
     
+    signed_items = [("NAV", nav_data, NAV_FIELDS), ("Risk", risk_data, RISK_FIELDS)]
+    for name, data, _ in signed_items:
+        print(f"\n{name} Response:")
+        print(json.dumps(data, indent=2))
+    
+    # Verify each response over its endpoint's signed fields (the decoded
+    # public key is cached across calls)
+    for name, data, fields in signed_items:
+        is_valid = verify_signature(data, data["sig"], public_key, fields)
+        print(f"\n{name} signature verification: {'✓ VALID' if is_valid else '✗ INVALID'}")
+    
     return 0
 
 
@@ -1,7 +1,7 @@
 """
 Mock provider adapter for KYC/AML compliance service
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from ..rules import deterministic_kyc_status, deterministic_aml_status, get_current_timestamp
 from ..schemas import redact_log_data
 import logging
@@ -13,52 +13,55 @@ class MockComplianceProvider:
     
     def __init__(self, seed: str = ""):
         self.seed = seed
+        self._seed_bytes = seed.encode()
     
-    def check_kyc(self, subject_id: str, **kwargs) -> Dict[str, Any]:
+    def check_kyc(self, subject_id: str, ts: Optional[int] = None, **kwargs) -> Dict[str, Any]:
         """
         Mock KYC check
         
         Args:
             subject_id: Subject identifier
+            ts: Optional Unix timestamp to stamp the result with (defaults to now)
             **kwargs: Additional KYC data (name, dob, docType, docLast4)
         
         Returns:
             KYC check result
         """
-        # Log request with redacted data
-        log_data = {"subjectId": subject_id, **kwargs}
-        redacted_data = redact_log_data(log_data)
-        logger.info(f"Mock KYC check: {redacted_data}")
+        # Log request with redacted data (skip redaction when INFO is off)
+        if logger.isEnabledFor(logging.INFO):
+            redacted_data = redact_log_data({"subjectId": subject_id, **kwargs})
+            logger.info("Mock KYC check: %s", redacted_data)
         
         # Generate deterministic response
-        result = deterministic_kyc_status(subject_id, self.seed)
+        result = deterministic_kyc_status(subject_id, self._seed_bytes)
         result["subjectId"] = subject_id
-        result["timestamp"] = get_current_timestamp()
+        result["timestamp"] = get_current_timestamp() if ts is None else ts
         
         # Log response (no PII)
-        logger.info(f"Mock KYC result: {result}")
+        logger.info("Mock KYC result: %s", result)
         
         return result
     
-    def screen_aml(self, subject_id: str) -> Dict[str, Any]:
+    def screen_aml(self, subject_id: str, ts: Optional[int] = None) -> Dict[str, Any]:
         """
         Mock AML screening
         
         Args:
             subject_id: Subject identifier
+            ts: Optional Unix timestamp to stamp the result with (defaults to now)
         
         Returns:
             AML screening result
         """
         # Log request
-        logger.info(f"Mock AML screening: {{'subjectId': '{subject_id}'}}")
+        logger.info("Mock AML screening: subjectId=%s", subject_id)
         
         # Generate deterministic response
-        result = deterministic_aml_status(subject_id, self.seed)
+        result = deterministic_aml_status(subject_id, self._seed_bytes)
         result["subjectId"] = subject_id
-        result["timestamp"] = get_current_timestamp()
+        result["timestamp"] = get_current_timestamp() if ts is None else ts
         
         # Log response
-        logger.info(f"Mock AML result: {result}")
+        logger.info("Mock AML result: %s", result)
         
         return result
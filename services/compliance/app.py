@@ -5,6 +5,7 @@ import os
 import logging
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from .schemas import KYCRequest, KYCResponse, AMLRequest, AMLResponse, redact_log_data
 from .adapters.mock_provider import MockComplianceProvider
@@ -18,7 +19,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="BRICS Compliance Service v0.1",
     description="KYC/AML compliance API with deterministic mock responses",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -44,7 +46,7 @@ def health():
         "seed": seed
     }
 
-@app.post("/v1/kyc/check", response_model=KYCResponse)
+@app.post("/v1/kyc/check", response_model=None, responses={200: {"model": KYCResponse}})
 def check_kyc(request: KYCRequest):
     """
     Perform KYC check for a subject
@@ -53,10 +55,10 @@ def check_kyc(request: KYCRequest):
     No PII is persisted or logged.
     """
     try:
-        # Log request with redacted data
-        log_data = request.model_dump()
-        redacted_data = redact_log_data(log_data)
-        logger.info(f"KYC check request: {redacted_data}")
+        # Log request with redacted data (skip redaction when INFO is off)
+        if logger.isEnabledFor(logging.INFO):
+            redacted_data = redact_log_data(request.model_dump())
+            logger.info("KYC check request: %s", redacted_data)
         
         # Perform KYC check
         result = provider.check_kyc(
@@ -67,14 +69,20 @@ def check_kyc(request: KYCRequest):
             docLast4=request.docLast4
         )
         
-        # Return response
-        return KYCResponse(**result)
+        # Return the provider's (already well-formed) result without re-validating
+        return ORJSONResponse({
+            "subjectId": result["subjectId"],
+            "status": result["status"],
+            "reasons": result["reasons"],
+            "confidence": result["confidence"],
+            "timestamp": result["timestamp"]
+        })
         
     except Exception as e:
-        logger.error(f"KYC check error: {str(e)}")
+        logger.error("KYC check error: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@app.post("/v1/aml/screen", response_model=AMLResponse)
+@app.post("/v1/aml/screen", response_model=None, responses={200: {"model": AMLResponse}})
 def screen_aml(request: AMLRequest):
     """
     Perform AML screening for a subject
@@ -84,18 +92,25 @@ def screen_aml(request: AMLRequest):
     """
     try:
         # Log request
-        logger.info(f"AML screening request: {request.model_dump()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("AML screening request: %s", request.model_dump())
         
         # Perform AML screening
         result = provider.screen_aml(subject_id=request.subjectId)
         
-        # Return response
-        return AMLResponse(**result)
+        # Return the provider's (already well-formed) result without re-validating
+        return ORJSONResponse({
+            "subjectId": result["subjectId"],
+            "status": result["status"],
+            "lists": result["lists"],
+            "score": result["score"],
+            "timestamp": result["timestamp"]
+        })
         
     except Exception as e:
-        logger.error(f"AML screening error: {str(e)}")
+        logger.error("AML screening error: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8002)
+    uvicorn.run(app, host="0.0.0.0", port=8002, loop="uvloop", http="httptools")
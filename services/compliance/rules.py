@@ -1,85 +1,138 @@
 """
 Deterministic mock rules for KYC/AML compliance service
 """
+import hashlib
 import os
+import struct
 import time
-from typing import Dict, Any, List
-from eth_utils import keccak, to_bytes
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, NamedTuple, Tuple, Union
+from Crypto.Hash import keccak
+
+_PREFIX_KYC = b"kyc:"
+_PREFIX_AML = b"aml:"
+_STATUS_WORDS = struct.Struct(">II")
+
+# Shared (immutable) statuses, reasons and lists returned by the deterministic rules
+_KYC_STATUSES = ("pass", "review", "fail")
+_KYC_REASONS = (
+    ("deterministic_mock_response",),
+    ("deterministic_mock_response", "additional_verification_required"),
+    ("deterministic_mock_response", "document_validation_failed"),
+)
+_AML_LISTS_CLEAR = ("ofac", "un", "eu_sanctions")
+_AML_LISTS_HIT = _AML_LISTS_CLEAR + ("high_risk_entities",)
+
+# Bound once so timestamping skips the module attribute lookup
+_now_ns = time.time_ns
+
+# Distinct (subject_id, seed) results kept per rule
+STATUS_CACHE_SIZE = 4096
+
+class KYCStatus(NamedTuple):
+    status: str
+    confidence: float
+    reasons: Tuple[str, ...]
+
+class AMLStatus(NamedTuple):
+    status: str
+    lists: Tuple[str, ...]
+    score: int
+
+def _keccak256(data: bytes) -> bytes:
+    return keccak.new(data=data, digest_bits=256).digest()
+
+def _sha256(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+# Status hash functions; keccak (the default) reproduces the golden vectors,
+# sha256 is much faster (OpenSSL, SHA-NI where available) but changes outputs
+HASH_FUNCTIONS: Dict[str, Callable[[bytes], bytes]] = {
+    "keccak": _keccak256,
+    "sha256": _sha256,
+}
+
+def get_hash_function(name: str) -> Callable[[bytes], bytes]:
+    """Get the status hash function for a COMPLIANCE_HASH value"""
+    try:
+        return HASH_FUNCTIONS[name]
+    except KeyError:
+        raise ValueError(f'COMPLIANCE_HASH must be one of: {", ".join(HASH_FUNCTIONS)}') from None
+
+_digest = get_hash_function(os.getenv('COMPLIANCE_HASH', 'keccak'))
+
+def _hash_words(prefix: bytes, subject_id: str, seed: Union[str, bytes]) -> tuple:
+    """Status hash of prefix + subject_id + ':' + seed, as its first two big-endian uint32s"""
+    if isinstance(seed, str):
+        seed = seed.encode()
+    data = prefix + subject_id.encode() + b":" + seed
+    return _STATUS_WORDS.unpack_from(_digest(data))
 
 def get_seed() -> str:
     """Get the seed for deterministic outputs"""
     return os.getenv('SEED', '')
 
-def deterministic_kyc_status(subject_id: str, seed: str = "") -> Dict[str, Any]:
-    """
-    Generate deterministic KYC status based on subject ID
-    
-    Args:
-        subject_id: Subject identifier
-        seed: Optional seed for determinism
-    
-    Returns:
-        Dictionary with status, confidence, and reasons
-    """
-    hash_input = f"kyc:{subject_id}:{seed}"
-    hash_bytes = keccak(to_bytes(text=hash_input))
+@lru_cache(maxsize=STATUS_CACHE_SIZE)
+def _kyc_status(subject_id: str, seed: Union[str, bytes]) -> KYCStatus:
+    """Cached KYC result; rules are pure functions of (subject_id, seed)"""
+    status_word, confidence_word = _hash_words(_PREFIX_KYC, subject_id, seed)
     
     # Use hash to determine status
-    status_value = int.from_bytes(hash_bytes[:4], 'big') % 3
-    status_map = {0: "pass", 1: "review", 2: "fail"}
+    status_value = status_word % 3
     
     # Use hash to determine confidence
-    confidence_value = int.from_bytes(hash_bytes[4:8], 'big') % 100
+    confidence_value = confidence_word % 100
     confidence = confidence_value / 100.0
     
-    # Generate reasons based on status
-    reasons = ["deterministic_mock_response"]
-    if status_value == 1:  # review
-        reasons.append("additional_verification_required")
-    elif status_value == 2:  # fail
-        reasons.append("document_validation_failed")
+    # Reasons based on status (review/fail add the cause)
+    return KYCStatus(_KYC_STATUSES[status_value], confidence, _KYC_REASONS[status_value])
+
+@lru_cache(maxsize=STATUS_CACHE_SIZE)
+def _aml_status(subject_id: str, seed: Union[str, bytes]) -> AMLStatus:
+    """Cached AML result; rules are pure functions of (subject_id, seed)"""
+    status_word, score_word = _hash_words(_PREFIX_AML, subject_id, seed)
+    
+    # Use hash to determine status
+    status_value = status_word % 10  # 10% chance of hit
+    status = "hit" if status_value == 0 else "clear"
+    
+    # Use hash to determine score
+    score = score_word % 100
     
-    return {
-        "status": status_map[status_value],
-        "confidence": confidence,
-        "reasons": reasons
-    }
+    # Lists based on status
+    return AMLStatus(status, _AML_LISTS_HIT if status == "hit" else _AML_LISTS_CLEAR, score)
 
-def deterministic_aml_status(subject_id: str, seed: str = "") -> Dict[str, Any]:
+def deterministic_kyc_status(subject_id: str, seed: Union[str, bytes] = "") -> Dict[str, Any]:
     """
-    Generate deterministic AML status based on subject ID
+    Generate deterministic KYC status based on subject ID
     
     Args:
         subject_id: Subject identifier
-        seed: Optional seed for determinism
+        seed: Optional seed for determinism (str, or pre-encoded UTF-8 bytes)
     
     Returns:
-        Dictionary with status, lists, and score
+        Dictionary with status, confidence, and reasons (a shared tuple); a new
+        dict per call, so callers may add fields to it
     """
-    hash_input = f"aml:{subject_id}:{seed}"
-    hash_bytes = keccak(to_bytes(text=hash_input))
-    
-    # Use hash to determine status
-    status_value = int.from_bytes(hash_bytes[:4], 'big') % 10  # 10% chance of hit
-    status = "hit" if status_value == 0 else "clear"
-    
-    # Use hash to determine score
-    score = int.from_bytes(hash_bytes[4:8], 'big') % 100
+    return _kyc_status(subject_id, seed)._asdict()
+
+def deterministic_aml_status(subject_id: str, seed: Union[str, bytes] = "") -> Dict[str, Any]:
+    """
+    Generate deterministic AML status based on subject ID
     
-    # Generate lists based on status
-    lists = ["ofac", "un", "eu_sanctions"]
-    if status == "hit":
-        lists.append("high_risk_entities")
+    Args:
+        subject_id: Subject identifier
+        seed: Optional seed for determinism (str, or pre-encoded UTF-8 bytes)
     
-    return {
-        "status": status,
-        "lists": lists,
-        "score": score
-    }
+    Returns:
+        Dictionary with status, lists (a shared tuple), and score; a new dict
+        per call, so callers may add fields to it
+    """
+    return _aml_status(subject_id, seed)._asdict()
 
 def get_current_timestamp() -> int:
     """Get current Unix timestamp"""
-    return int(time.time())
+    return _now_ns() // 1_000_000_000
 
 def validate_kyc_golden_vector(subject_id: str = "ALPHA-001", seed: str = "") -> Dict[str, Any]:
     """
@@ -1,10 +1,32 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
 import re
-from datetime import datetime
+from datetime import date
 
 # Fields that should be redacted in logs
 LOG_REDACTED_FIELDS = ["name", "dob", "docLast4"]
+_REDACTED = frozenset(LOG_REDACTED_FIELDS)
+
+# Validator patterns, compiled once at import
+_SUBJECT_RE = re.compile(r'^[A-Za-z0-9\-_\.]+$')
+_NAME_RE = re.compile(r'^[A-Za-z\s\-\.]+$')
+_DOB_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_DOC4_RE = re.compile(r'^\d{4}$')
+
+_SUBJECT_ID_ERROR = 'Subject ID must contain only alphanumeric characters, hyphens, underscores, and dots'
+
+# Allowed values and their (precomputed) validation error messages
+_DOC_TYPES = ("passport", "drivers_license", "national_id")
+_VALID_DOC_TYPES = frozenset(_DOC_TYPES)
+_DOC_TYPE_ERROR = f'Document type must be one of: {", ".join(_DOC_TYPES)}'
+
+_KYC_STATUSES = ("pass", "review", "fail")
+_VALID_KYC_STATUSES = frozenset(_KYC_STATUSES)
+_KYC_STATUS_ERROR = f'Status must be one of: {", ".join(_KYC_STATUSES)}'
+
+_AML_STATUSES = ("clear", "hit")
+_VALID_AML_STATUSES = frozenset(_AML_STATUSES)
+_AML_STATUS_ERROR = f'Status must be one of: {", ".join(_AML_STATUSES)}'
 
 class KYCRequest(BaseModel):
     subjectId: str = Field(
@@ -35,15 +57,15 @@ class KYCRequest(BaseModel):
     @field_validator('subjectId')
     @classmethod
     def validate_subject_id(cls, v):
-        if not re.match(r'^[A-Za-z0-9\-_\.]+$', v):
-            raise ValueError('Subject ID must contain only alphanumeric characters, hyphens, underscores, and dots')
+        if not _SUBJECT_RE.match(v):
+            raise ValueError(_SUBJECT_ID_ERROR)
         return v
     
     @field_validator('name')
     @classmethod
     def validate_name(cls, v):
         if v is not None:
-            if not re.match(r'^[A-Za-z\s\-\.]+$', v):
+            if not _NAME_RE.match(v):
                 raise ValueError('Name must contain only letters, spaces, hyphens, and dots')
         return v
     
@@ -51,10 +73,12 @@ class KYCRequest(BaseModel):
     @classmethod
     def validate_dob(cls, v):
         if v is not None:
-            if not re.match(r'^\d{4}-\d{2}-\d{2}$', v):
+            # fullmatch: '$' also matches before a trailing newline, which strptime rejected
+            if not _DOB_RE.fullmatch(v):
                 raise ValueError('Date of birth must be in YYYY-MM-DD format')
+            # date() checks the calendar without strptime's module-level lock
             try:
-                datetime.strptime(v, '%Y-%m-%d')
+                date(int(v[:4]), int(v[5:7]), int(v[8:]))
             except ValueError:
                 raise ValueError('Invalid date format')
         return v
@@ -63,16 +87,15 @@ class KYCRequest(BaseModel):
     @classmethod
     def validate_doc_type(cls, v):
         if v is not None:
-            valid_types = ["passport", "drivers_license", "national_id"]
-            if v not in valid_types:
-                raise ValueError(f'Document type must be one of: {", ".join(valid_types)}')
+            if v not in _VALID_DOC_TYPES:
+                raise ValueError(_DOC_TYPE_ERROR)
         return v
     
     @field_validator('docLast4')
     @classmethod
     def validate_doc_last4(cls, v):
         if v is not None:
-            if not re.match(r'^\d{4}$', v):
+            if not _DOC4_RE.match(v):
                 raise ValueError('Document last 4 must be exactly 4 digits')
         return v
 
@@ -100,9 +123,8 @@ class KYCResponse(BaseModel):
     @field_validator('status')
     @classmethod
     def validate_status(cls, v):
-        valid_statuses = ["pass", "review", "fail"]
-        if v not in valid_statuses:
-            raise ValueError(f'Status must be one of: {", ".join(valid_statuses)}')
+        if v not in _VALID_KYC_STATUSES:
+            raise ValueError(_KYC_STATUS_ERROR)
         return v
 
 class AMLRequest(BaseModel):
@@ -116,8 +138,8 @@ class AMLRequest(BaseModel):
     @field_validator('subjectId')
     @classmethod
     def validate_subject_id(cls, v):
-        if not re.match(r'^[A-Za-z0-9\-_\.]+$', v):
-            raise ValueError('Subject ID must contain only alphanumeric characters, hyphens, underscores, and dots')
+        if not _SUBJECT_RE.match(v):
+            raise ValueError(_SUBJECT_ID_ERROR)
         return v
 
 class AMLResponse(BaseModel):
@@ -144,15 +166,10 @@ class AMLResponse(BaseModel):
     @field_validator('status')
     @classmethod
     def validate_status(cls, v):
-        valid_statuses = ["clear", "hit"]
-        if v not in valid_statuses:
-            raise ValueError(f'Status must be one of: {", ".join(valid_statuses)}')
+        if v not in _VALID_AML_STATUSES:
+            raise ValueError(_AML_STATUS_ERROR)
         return v
 
 def redact_log_data(data: dict) -> dict:
     """Redact sensitive fields for logging"""
-    redacted = data.copy()
-    for field in LOG_REDACTED_FIELDS:
-        if field in redacted:
-            redacted[field] = "[REDACTED]"
-    return redacted
+    return {k: ("[REDACTED]" if k in _REDACTED else v) for k, v in data.items()}
@@ -1,14 +1,23 @@
 import os
 import logging
+from typing import Any, Dict, List, Tuple
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from eth_utils import to_bytes
 from .schemas import ScoreRequest, ScoreResponse, PriceRequest, PriceResponse
-from .baseline_model import score_risk, price_cds, get_risk_score_bps
-from .signing import digest, sign_digest, load_or_create_key, public_address
+from .baseline_model import score_risk, score_risk_batch, price_cds, get_risk_score_bps
+from .signing import digest, sign_digest, sign_many, load_or_create_key, public_address
 
 load_dotenv()
-app = FastAPI(title="BRICS Pricing v0.1")
+# Responses are returned as plain dicts serialized by orjson; the response
+# models below only document the schema
+app = FastAPI(title="BRICS Pricing v0.1", default_response_class=ORJSONResponse)
+
+# Hex digests and signatures compress well; smaller responses (bytes) are sent as-is
+GZIP_MINIMUM_SIZE = int(os.getenv('GZIP_MINIMUM_SIZE', '512'))
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=5)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -28,28 +37,26 @@ logger.info(f"Risk Oracle Address: {RISK_ORACLE_ADDR}")
 def health():
     return {"status": "ok", "oracle": RISK_ORACLE_ADDR}
 
-@app.post("/v1/score", response_model=ScoreResponse)
+@app.post("/v1/score", response_model=None, responses={200: {"model": ScoreResponse}})
 def score(req: ScoreRequest):
     """Score risk for an obligor"""
     # Score the risk
     score_result = score_risk(req.features, req.obligorId, req.tenorDays, req.asOf)
     
-    return ScoreResponse(
-        obligorId=req.obligorId,
-        tenorDays=req.tenorDays,
-        asOf=req.asOf,
-        pdBps=score_result['pdBps'],
-        lgdBps=score_result['lgdBps'],
-        scoreConfidence=score_result['scoreConfidence']
-    )
+    return ORJSONResponse({
+        "obligorId": req.obligorId,
+        "tenorDays": req.tenorDays,
+        "asOf": req.asOf,
+        "pdBps": score_result['pdBps'],
+        "lgdBps": score_result['lgdBps'],
+        "scoreConfidence": score_result['scoreConfidence']
+    })
 
-@app.post("/v1/price", response_model=PriceResponse)
-def price(req: PriceRequest):
-    """Price CDS for an obligor"""
-    # First score the risk
-    score_result = score_risk(req.features, req.obligorId, req.tenorDays, req.asOf)
-    
-    # Then price the CDS
+# Fixed portfolio ID for now
+PORTFOLIO_ID = to_bytes(hexstr='0x' + '11' * 32)
+
+def _price_unsigned(req: PriceRequest, score_result: Dict[str, Any]) -> Tuple[Dict[str, Any], bytes]:
+    """Price and digest one request from its risk score; the record lacks its signature"""
     price_result = price_cds(
         req.obligorId, 
         req.tenorDays, 
@@ -59,12 +66,11 @@ def price(req: PriceRequest):
         req.asOf
     )
     
-    # Generate real digest and signature
-    portfolio_id = to_bytes(hexstr='0x' + '11' * 32)  # Use fixed portfolio ID for now
+    # Generate real digest
     risk_score_bps = get_risk_score_bps(score_result['pdBps'], score_result['lgdBps'])
     
     digest_bytes = digest(
-        portfolio_id,
+        PORTFOLIO_ID,
         req.asOf,
         risk_score_bps,
         price_result['correlationBps'],
@@ -73,17 +79,42 @@ def price(req: PriceRequest):
         req.features
     )
     
-    signature = sign_digest(digest_bytes, RISK_ORACLE_PK)
+    record = {
+        "obligorId": req.obligorId,
+        "tenorDays": req.tenorDays,
+        "asOf": req.asOf,
+        "notional": req.notional,
+        "fairSpreadBps": price_result['fairSpreadBps'],
+        "correlationBps": price_result['correlationBps'],
+        "digest": "0x" + digest_bytes.hex(),
+    }
+    return record, digest_bytes
+
+@app.post("/v1/price", response_model=None, responses={200: {"model": PriceResponse}})
+def price(req: PriceRequest):
+    """Price CDS for an obligor"""
+    # First score the risk, then price the CDS
+    score_result = score_risk(req.features, req.obligorId, req.tenorDays, req.asOf)
+    record, digest_bytes = _price_unsigned(req, score_result)
+    record["signature"] = sign_digest(digest_bytes, RISK_ORACLE_PK)
+    return ORJSONResponse(record)
+
+@app.post("/v1/price/batch", response_model=None, responses={200: {"model": List[PriceResponse]}})
+def price_batch(reqs: List[PriceRequest]):
+    """Price CDS for many obligors in one request
     
-    return PriceResponse(
-        obligorId=req.obligorId,
-        tenorDays=req.tenorDays,
-        asOf=req.asOf,
-        notional=req.notional,
-        fairSpreadBps=price_result['fairSpreadBps'],
-        correlationBps=price_result['correlationBps'],
-        digest="0x" + digest_bytes.hex(),
-        signature=signature
-    )
+    Each entry gets the same digest and signature /v1/price would return, so
+    every record stays independently verifiable on-chain. Digests are signed
+    together so the oracle key is resolved once per batch.
+    """
+    score_results = score_risk_batch([req.features for req in reqs])
+    unsigned = [_price_unsigned(req, result) for req, result in zip(reqs, score_results)]
+    signatures = sign_many([digest_bytes for _, digest_bytes in unsigned], RISK_ORACLE_PK)
+    records = []
+    for (record, _), signature in zip(unsigned, signatures):
+        record["signature"] = signature
+        records.append(record)
+    return ORJSONResponse(records)
 
 # Run locally: uvicorn app:app --reload --port 8001
+# Production: uvicorn app:app --port 8001 --loop uvloop --http httptools
@@ -1,11 +1,41 @@
+import array
 import os
 import math
-from typing import Dict, Any
-from eth_utils import keccak, to_bytes
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence
+import numpy as np
+try:
+    from .determinism import keccak256
+except ImportError:
+    # Allow running as script (see cli.py)
+    from determinism import keccak256
+
+# score_risk inputs in column order for score_risk_batch; PD weights apply to the first five
+_FEATURE_ORDER = (
+    'size', 'leverage', 'volatility', 'fxExposure', 'countryRisk',
+    'industryStress', 'collateralQuality', 'dataQuality', 'modelShift',
+)
+_PD_WEIGHTS = np.array([50, 80, 40, 30, 20], dtype=np.float64)
+
+# rp_bps = 0.6 * sqrt(max(pdBps, 1)) for every pdBps score_risk can produce (clamped to 5..3000)
+_RP_TABLE = array.array('d', [0.6 * math.sqrt(max(i, 1)) for i in range(3001)])
+
+# Model configuration, read from the environment once; see reload_config
+_SEED: str = '42'
+_JITTER_OVERRIDE: Optional[int] = None
+
+def reload_config() -> None:
+    """Re-read SEED and MODEL_JITTER_BPS_OVERRIDE (e.g. after tests change the environment)"""
+    global _SEED, _JITTER_OVERRIDE
+    _SEED = os.getenv('SEED', '42')
+    override = os.getenv('MODEL_JITTER_BPS_OVERRIDE')
+    _JITTER_OVERRIDE = int(override) if override is not None else None
+
+reload_config()
 
 def get_seed() -> str:
     """Get the seed for deterministic outputs"""
-    return os.getenv('SEED', '42')
+    return _SEED
 
 def round_half_up(value: float) -> int:
     """Round half-up (not Python's bankers' rounding)"""
@@ -29,17 +59,22 @@ def jitter_bps(seed: str, obligor_id: str, tenor_days: int, as_of: int) -> int:
         jitter in basis points [-5, +5]
     """
     # Check for override
-    override = os.getenv('MODEL_JITTER_BPS_OVERRIDE')
+    override = _JITTER_OVERRIDE
     if override is not None:
-        return int(override)
+        return override
     
     # If SEED is empty, treat jitter as 0
     if not seed:
         return 0
     
+    return _jitter_cached(obligor_id, tenor_days, as_of, seed)
+
+@lru_cache(maxsize=4096)
+def _jitter_cached(obligor_id: str, tenor_days: int, as_of: int, seed: str) -> int:
+    """Keccak jitter memoized per (obligorId, tenorDays, asOf, seed); SEED changes miss the cache"""
     # Default: compute keccak256(utf8(obligorId + ":" + tenorDays + ":" + asOf + ":" + seed))
     input_str = f"{obligor_id}:{tenor_days}:{as_of}:{seed}"
-    hash_bytes = keccak(to_bytes(text=input_str))
+    hash_bytes = keccak256(input_str.encode("utf-8"))
     
     # Take last 2 bytes mod 11, then value - 5
     last_two_bytes = hash_bytes[-2:]
@@ -96,6 +131,67 @@ def score_risk(features: Dict[str, Any], obligor_id: str, tenor_days: int, as_of
         'scoreConfidence': score_confidence
     }
 
+def score_risk_batch(features_list: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    score_risk over many obligors at once, with identical results
+    
+    Features are stacked into an (N, 9) float64 matrix and each formula is
+    evaluated column-wise. Terms are accumulated in the same order as the
+    scalar path (rather than as one BLAS dot product, whose summation order
+    and FMA use vary) so every float result is bit-identical.
+    
+    Stacking would also coerce numeric strings (and None, to NaN), which
+    score_risk rejects, so a row with any non-int/float feature is scored by
+    score_risk itself; bools score as 0/1 on both paths.
+    """
+    for i, features in enumerate(features_list):
+        if not all(isinstance(features.get(name, 0.0), (int, float)) for name in _FEATURE_ORDER):
+            # Earlier rows first, so errors surface in row order; score_risk's
+            # obligor, tenor and asOf arguments do not affect the score
+            scored = _score_risk_matrix(features_list[:i])
+            scored.append(score_risk(features, '', 0, 0))
+            return scored + score_risk_batch(features_list[i + 1:])
+    return _score_risk_matrix(features_list)
+
+def _score_risk_matrix(features_list: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Vectorized score_risk_batch body for rows whose features are all int/float"""
+    n = len(features_list)
+    feats = np.fromiter(
+        (f.get(name, 0.0) for f in features_list for name in _FEATURE_ORDER),
+        dtype=np.float64, count=n * len(_FEATURE_ORDER),
+    ).reshape(n, len(_FEATURE_ORDER))
+    
+    # NaN/inf inputs are reported below, as score_risk does, rather than warned about
+    with np.errstate(invalid='ignore', over='ignore'):
+        pd_bps_raw = feats[:, 0] * _PD_WEIGHTS[0]
+        for i in range(1, len(_PD_WEIGHTS)):
+            pd_bps_raw = pd_bps_raw + feats[:, i] * _PD_WEIGHTS[i]
+        lgd_bps_raw = 4500 + 10 * feats[:, 5] - 5 * feats[:, 6]
+        score_confidence_raw = 0.50 + 0.05 * feats[:, 7] - 0.03 * feats[:, 8]
+    
+    # NaN/inf would cast to arbitrary int64 values; raise what score_risk's
+    # round_half_up raises for the first such obligor (PD before LGD)
+    non_finite = ~(np.isfinite(pd_bps_raw) & np.isfinite(lgd_bps_raw))
+    if non_finite.any():
+        i = int(np.argmax(non_finite))
+        value = pd_bps_raw[i] if not np.isfinite(pd_bps_raw[i]) else lgd_bps_raw[i]
+        if np.isnan(value):
+            raise ValueError("cannot convert float NaN to integer")
+        raise OverflowError("cannot convert float infinity to integer")
+    
+    # floor(x + 0.5) is round_half_up for every value that survives the clamp
+    pd_bps = np.clip(np.floor(pd_bps_raw + 0.5), 5, 3000).astype(np.int64)
+    lgd_bps = np.clip(np.floor(lgd_bps_raw + 0.5), 2000, 9000).astype(np.int64)
+    
+    # clamp() maps a NaN confidence to its upper bound; np.clip would keep NaN
+    score_confidence = np.where(np.isnan(score_confidence_raw), 0.95,
+                                np.clip(score_confidence_raw, 0.30, 0.95))
+    
+    return [
+        {'pdBps': pd, 'lgdBps': lgd, 'scoreConfidence': conf}
+        for pd, lgd, conf in zip(pd_bps.tolist(), lgd_bps.tolist(), score_confidence.tolist())
+    ]
+
 def price_cds(obligor_id: str, tenor_days: int, features: Dict[str, Any], 
               pd_bps: int, lgd_bps: int, as_of: int) -> Dict[str, Any]:
     """
@@ -113,7 +209,10 @@ def price_cds(obligor_id: str, tenor_days: int, features: Dict[str, Any],
     
     # Calculate risk premium
     # rp_bps = 0.6 * sqrt(max(pdBps, 1))
-    rp_bps = 0.6 * math.sqrt(max(pd_bps, 1))
+    if type(pd_bps) is int and 0 <= pd_bps <= 3000:
+        rp_bps = _RP_TABLE[pd_bps]
+    else:
+        rp_bps = 0.6 * math.sqrt(max(pd_bps, 1))
     
     # Calculate fair spread
     # fairSpreadBps_raw = EL_bps + liq_bps + rp_bps
@@ -8,6 +8,8 @@ import sys
 import time
 from typing import Dict, Any
 
+import orjson
+
 try:
     from .baseline_model import score_risk, price_cds, get_risk_score_bps
     from .signing import digest, sign_digest, load_or_create_key, public_address
@@ -31,6 +33,22 @@ def create_sample_features() -> Dict[str, Any]:
         "modelShift": 0.1
     }
 
+def parse_features(text: str) -> Dict[str, Any]:
+    """Parse the --features JSON object, exiting with an error if it is invalid"""
+    try:
+        features = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        print(f"Error: Invalid JSON in features '{text}'")
+        sys.exit(1)
+    if not isinstance(features, dict):
+        print(f"Error: Features must be a JSON object, got '{text}'")
+        sys.exit(1)
+    return features
+
+def format_features(features: Dict[str, Any]) -> str:
+    """Pretty-print features for the verbose CLI output"""
+    return orjson.dumps(features, option=orjson.OPT_INDENT_2).decode()
+
 def price_command(args):
     """Handle the price command"""
     obligor_id = args.obligor
@@ -48,14 +66,7 @@ def price_command(args):
             sys.exit(1)
     
     # Use provided features or defaults
-    if args.features:
-        try:
-            features = json.loads(args.features)
-        except json.JSONDecodeError:
-            print(f"Error: Invalid JSON in features '{args.features}'")
-            sys.exit(1)
-    else:
-        features = create_sample_features()
+    features = parse_features(args.features) if args.features else create_sample_features()
     
     # Only print verbose output if not --json-only
     if not getattr(args, 'json_only', False):
@@ -63,7 +74,7 @@ def price_command(args):
         print(f"Tenor: {tenor_days} days")
         print(f"Notional: {notional:,}")
         print(f"As of: {as_of}")
-        print(f"Features: {json.dumps(features, indent=2)}")
+        print(f"Features: {format_features(features)}")
         print("-" * 50)
     
     # Score the risk
@@ -150,19 +161,12 @@ def score_command(args):
             sys.exit(1)
     
     # Use provided features or defaults
-    if args.features:
-        try:
-            features = json.loads(args.features)
-        except json.JSONDecodeError:
-            print(f"Error: Invalid JSON in features '{args.features}'")
-            sys.exit(1)
-    else:
-        features = create_sample_features()
+    features = parse_features(args.features) if args.features else create_sample_features()
     
     print(f"Scoring risk for obligor: {obligor_id}")
     print(f"Tenor: {tenor_days} days")
     print(f"As of: {as_of}")
-    print(f"Features: {json.dumps(features, indent=2)}")
+    print(f"Features: {format_features(features)}")
     print("-" * 50)
     
     # Score the risk
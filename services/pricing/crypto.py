@@ -1,9 +1,27 @@
 import os
-from eth_utils import to_checksum_address
+from functools import lru_cache
+from typing import Callable, Optional
 from eth_keys import keys
+from eth_utils import to_checksum_address
+
+try:
+    import coincurve
+except ImportError:  # coincurve is optional; signing goes through eth_keys instead
+    coincurve = None
+
+try:
+    from .determinism import keccak256
+except ImportError:
+    # Allow running as script (see cli.py)
+    from determinism import keccak256
 
 def load_or_create_key():
-    pk_hex = os.getenv('ORACLE_PRIVATE_KEY')
+    # Cached per ORACLE_PRIVATE_KEY value, so the ephemeral dev key is generated
+    # once per process instead of on every call
+    return _key_for(os.getenv('ORACLE_PRIVATE_KEY'))
+
+@lru_cache(maxsize=4)
+def _key_for(pk_hex: Optional[str]) -> keys.PrivateKey:
     if not pk_hex:
         # create ephemeral key for local/dev; do NOT persist
         pk = keys.PrivateKey(os.urandom(32))
@@ -11,10 +29,31 @@ def load_or_create_key():
         pk = keys.PrivateKey(bytes.fromhex(pk_hex[2:] if pk_hex.startswith('0x') else pk_hex))
     return pk
 
+@lru_cache(maxsize=4)
+def _raw_signer(priv: keys.PrivateKey) -> Callable[[bytes], bytes]:
+    """Signer of raw digests (no EIP-191 prefix) returning 65-byte r||s||v, resolved once per key"""
+    if coincurve is not None:
+        # libsecp256k1 directly: 65-byte r||s||recid with recid 0/1 and low-s,
+        # the same layout eth_keys' Signature.to_bytes produces
+        sign_recoverable = coincurve.PrivateKey(priv.to_bytes()).sign_recoverable
+        return lambda digest: sign_recoverable(digest, hasher=None)
+    return lambda digest: priv.sign_msg_hash(digest).to_bytes()
+
+def _recover_raw(digest: bytes, sig_bytes: bytes) -> str:
+    """Recover the signer address from a raw digest (no EIP-191 prefix) and 65-byte signature"""
+    if coincurve is not None:
+        if len(sig_bytes) != 65 or sig_bytes[64] > 1:
+            raise ValueError("Signature must be 65 bytes with recovery id 0 or 1")
+        public_key = coincurve.PublicKey.from_signature_and_message(sig_bytes, digest, hasher=None)
+        return to_checksum_address(keccak256(public_key.format(compressed=False)[1:])[-20:])
+    public_key = keys.Signature(sig_bytes).recover_public_key_from_msg_hash(digest)
+    return public_key.to_checksum_address()
+
 def sign_digest(priv: keys.PrivateKey, digest: bytes) -> str:
-    sig = priv.sign_msg_hash(digest)
     # 65-byte (r,s,v) → 0x...
-    return '0x' + sig.to_bytes().hex()
+    return '0x' + _raw_signer(priv)(digest).hex()
 
+@lru_cache(maxsize=4)
 def public_address(priv: keys.PrivateKey) -> str:
-    return to_checksum_address(priv.public_key.to_checksum_address())
+    # to_checksum_address already returns the EIP-55 checksummed form
+    return priv.public_key.to_checksum_address()
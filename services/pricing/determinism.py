@@ -1,18 +1,129 @@
-from eth_utils import keccak, to_bytes
-from eth_abi import encode
-from typing import Dict, Any
+from Crypto.Hash import keccak as _keccak
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+import enum
+import hashlib
 import json
+import re
+import uuid
+import orjson
+
+# datetime/dataclass values go to orjson's (absent) default hook and raise, so
+# they reach json.dumps and fail there too instead of being hashed
+_ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+# orjson output that can differ from json.dumps: raw DEL (stdlib escapes it),
+# NaN/Infinity (emitted as null), floats below 1e-4 (positional 0.0000...) or
+# in exponent notation (orjson writes 1e16 / 1e-7, stdlib 1e+16 / 1e-07).
+# Plain substring tests plus one literal-led regex are far cheaper than a
+# single alternation; matches inside strings only cost a stdlib fallback.
+_ORJSON_EXPONENT = re.compile(rb'e[-0-9]')
+
+def _orjson_divergent(blob: bytes) -> bool:
+    return (b'\x7f' in blob or b'null' in blob or b'0.0000' in blob
+            or _ORJSON_EXPONENT.search(blob) is not None)
+
+def _has_orjson_only_value(value: Any) -> bool:
+    # UUIDs and plain enums have no orjson passthrough option but json.dumps rejects them
+    if isinstance(value, dict):
+        return any(_has_orjson_only_value(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_orjson_only_value(item) for item in value)
+    return isinstance(value, (uuid.UUID, enum.Enum)) and not isinstance(value, (int, str))
+
+def canonical_features_json(features: Dict[str, Any]) -> bytes:
+    """Sorted-key, compact JSON of features, byte-identical to json.dumps."""
+    try:
+        blob = orjson.dumps(features, option=_ORJSON_OPTIONS)
+    except TypeError:
+        # >64-bit integers, non-string keys, or types json.dumps rejects too
+        blob = None
+    if (blob is not None and blob.isascii() and not _orjson_divergent(blob)
+            and not _has_orjson_only_value(features)):
+        return blob
+    # Non-ASCII text is \u-escaped by json.dumps but emitted raw by orjson
+    return json.dumps(features, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+# keccak256(b'') -- original Keccak padding, unlike hashlib's sha3_256
+_KECCAK256_EMPTY = bytes.fromhex('c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470')
+
+def _hashlib_keccak256_name() -> Optional[str]:
+    """Name of a hashlib Keccak-256 algorithm, if the OpenSSL build provides one"""
+    for name in ('keccak_256', 'KECCAK-256'):
+        try:
+            if hashlib.new(name, b'').digest() == _KECCAK256_EMPTY:
+                return name
+        except ValueError:
+            continue
+    return None
+
+_HASHLIB_KECCAK256 = _hashlib_keccak256_name()
+
+if _HASHLIB_KECCAK256 is not None:
+    def keccak256(data: bytes) -> bytes:
+        """Keccak-256 in a single hashlib (OpenSSL) call"""
+        return hashlib.new(_HASHLIB_KECCAK256, data).digest()
+else:
+    def keccak256(data: bytes) -> bytes:
+        """Keccak-256 straight from pycryptodome, skipping eth_utils' dispatch layers"""
+        return _keccak.new(data=data, digest_bits=256).digest()
+
+# The request feature schema (see baseline_model._FEATURE_ORDER), pre-sorted so
+# full feature dicts skip the per-call sort in _freeze
+_SORTED_FEATURE_KEYS = tuple(sorted((
+    'size', 'leverage', 'volatility', 'fxExposure', 'countryRisk',
+    'industryStress', 'collateralQuality', 'dataQuality', 'modelShift',
+)))
+_FEATURE_KEY_SET = frozenset(_SORTED_FEATURE_KEYS)
+
+def _freeze(value: Any) -> Tuple[Any, ...]:
+    """Hashable form of a JSON value that equals another only if both serialize identically.
+
+    Dicts become their sorted items and lists/tuples their frozen elements.
+    Scalars are keyed with their types (``True``/``1``/``1.0`` differ in
+    JSON), and float zeros with their repr since ``0.0 == -0.0``. Raises
+    TypeError for unhashable values or unsortable keys.
+    """
+    cls = value.__class__
+    if cls is dict:
+        if value.keys() == _FEATURE_KEY_SET:
+            return (dict, tuple([(name, _freeze(value[name])) for name in _SORTED_FEATURE_KEYS]))
+        return (dict, tuple(sorted((name, _freeze(item)) for name, item in value.items())))
+    if cls is list or cls is tuple:
+        return (list, tuple(_freeze(item) for item in value))
+    if cls is float and value == 0.0:
+        return (float, value, repr(value))
+    return (cls, value)
+
+def _thaw(frozen: Tuple[Any, ...]) -> Any:
+    """Rebuild a JSON value from its _freeze form"""
+    cls = frozen[0]
+    if cls is dict:
+        return {name: _thaw(item) for name, item in frozen[1]}
+    if cls is list:
+        return [_thaw(item) for item in frozen[1]]
+    return frozen[1]
+
+@lru_cache(maxsize=4096)
+def _features_hash_cached(key: Tuple[Any, ...]) -> bytes:
+    return keccak256(canonical_features_json(_thaw(key)))
 
 def canonical_features_hash(features: Dict[str, Any]) -> bytes:
-    blob = json.dumps(features, separators=(',', ':'), sort_keys=True).encode('utf-8')
-    return keccak(blob)
+    # Memoized by frozen features; unhashable values are hashed directly
+    try:
+        key = _freeze(features)
+        hash(key)
+    except TypeError:
+        return keccak256(canonical_features_json(features))
+    return _features_hash_cached(key)
 
 def model_id_hash(model_id: str) -> bytes:
-    return keccak(text=model_id)
+    return keccak256(model_id.encode('utf-8'))
 
 def compute_outputs(portfolio_id: bytes, as_of: int, features_hash: bytes) -> Dict[str, int]:
     # Deterministic stub: derive numbers from hashes; bounded to sensible ranges.
-    k = keccak(portfolio_id + as_of.to_bytes(8, 'big') + features_hash)
+    # One join builds the 72-byte preimage without intermediate concatenations
+    k = keccak256(b''.join((portfolio_id, as_of.to_bytes(8, 'big'), features_hash)))
     # Use 32 bytes as big int
     x = int.from_bytes(k, 'big')
     riskScore      = x % (10**24)            # 0 .. 1e24-1 (plenty of headroom)
@@ -20,12 +131,35 @@ def compute_outputs(portfolio_id: bytes, as_of: int, features_hash: bytes) -> Di
     spreadBps      = 100 + (x % 1901)        # 100..2000
     return dict(riskScore=riskScore, correlationBps=correlationBps, spreadBps=spreadBps)
 
+def _word_bytes32(value: bytes) -> bytes:
+    if not isinstance(value, bytes) or len(value) > 32:
+        raise ValueError(f"bytes32 value must be at most 32 bytes, got {value!r}")
+    return value.ljust(32, b'\x00')
+
+def _word_uint(value: int, bits: int) -> bytes:
+    if isinstance(value, bool) or not isinstance(value, int) or not 0 <= value < 1 << bits:
+        raise ValueError(f"uint{bits} value out of range: {value!r}")
+    return value.to_bytes(32, 'big')
+
+def _encode_fixed(portfolio_id: bytes, as_of: int, risk_score: int,
+                  correlation_bps: int, spread_bps: int, model_id_hash: bytes,
+                  features_hash: bytes) -> bytes:
+    # abi.encode of (bytes32,uint64,uint256,uint16,uint16,bytes32,bytes32): all
+    # static types, so the encoding is just seven 32-byte head words
+    return b''.join((
+        _word_bytes32(portfolio_id),
+        _word_uint(as_of, 64),
+        _word_uint(risk_score, 256),
+        _word_uint(correlation_bps, 16),
+        _word_uint(spread_bps, 16),
+        _word_bytes32(model_id_hash),
+        _word_bytes32(features_hash),
+    ))
+
 def digest_for_signing(portfolio_id: bytes, as_of: int, risk_score: int,
                        correlation_bps: int, spread_bps: int, model_id_hash: bytes,
                        features_hash: bytes) -> bytes:
     # abi.encode(types, values) then keccak
-    encoded = encode(
-        ['bytes32','uint64','uint256','uint16','uint16','bytes32','bytes32'],
-        [portfolio_id, as_of, risk_score, correlation_bps, spread_bps, model_id_hash, features_hash]
-    )
-    return keccak(encoded)
+    encoded = _encode_fixed(portfolio_id, as_of, risk_score, correlation_bps,
+                            spread_bps, model_id_hash, features_hash)
+    return keccak256(encoded)
@@ -1,7 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Any, Dict
 
-class ScoreRequest(BaseModel):
+class RequestModel(BaseModel):
+    # Requests are read-only once validated; unknown fields are dropped.
+    # features stays Dict[str, Any]: its values are hashed as sent, so coercing
+    # them (e.g. ints to floats) would change the signed features hash
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
+class ScoreRequest(RequestModel):
     obligorId: str = Field(..., description="Obligor identifier")
     tenorDays: int = Field(..., description="Tenor in days")
     asOf: int = Field(..., description="unix seconds (uint64)")
@@ -15,7 +21,7 @@ class ScoreResponse(BaseModel):
     lgdBps: int = Field(..., description="Loss given default in basis points")
     scoreConfidence: float = Field(..., description="Confidence score (0.0-1.0)")
 
-class PriceRequest(BaseModel):
+class PriceRequest(RequestModel):
     obligorId: str = Field(..., description="Obligor identifier")
     tenorDays: int = Field(..., description="Tenor in days")
     asOf: int = Field(..., description="unix seconds (uint64)")
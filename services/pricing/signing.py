@@ -2,22 +2,30 @@
 Signing utilities for BRICS Pricing Service with exact parity to RiskSignalLib.sol
 """
 import os
-from typing import Dict, Any
-from eth_abi import encode
-from eth_utils import keccak, to_bytes
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from eth_keys import keys
-from eth_account import Account
-import json
+
+try:
+    from .crypto import _raw_signer, _recover_raw
+    from .determinism import keccak256 as _keccak256, _encode_fixed
+    from .determinism import canonical_features_hash as _canonical_features_hash
+except ImportError:
+    # Allow running as script (see cli.py)
+    from crypto import _raw_signer, _recover_raw
+    from determinism import keccak256 as _keccak256, _encode_fixed
+    from determinism import canonical_features_hash as _canonical_features_hash
 
 def canonical_features_hash(features: Dict[str, Any]) -> bytes:
     """Generate canonical hash of features dict (sorted keys)"""
-    # Sort keys for deterministic ordering
-    canonical = json.dumps(features, sort_keys=True, separators=(',', ':'))
-    return keccak(to_bytes(text=canonical))
+    # keccak256 of json.dumps(sort_keys=True, separators=(',', ':')), memoized
+    # per distinct features value (see determinism.canonical_features_hash)
+    return _canonical_features_hash(features)
 
+@lru_cache(maxsize=16)
 def model_id_hash(model_id: str) -> bytes:
-    """Generate keccak256 hash of model ID string"""
-    return keccak(to_bytes(text=model_id))
+    """Generate keccak256 hash of model ID string (memoized per model ID)"""
+    return _keccak256(model_id.encode("utf-8"))
 
 def encode_payload(portfolio_id: bytes, as_of: int, risk_score: int,
                   correlation_bps: int, spread_bps: int, model_id_hash: bytes,
@@ -37,12 +45,12 @@ def encode_payload(portfolio_id: bytes, as_of: int, risk_score: int,
     Returns:
         bytes32 digest matching Solidity keccak256(abi.encode(...))
     """
-    # Exact field order and types from RiskSignalLib.Payload
-    encoded = encode(
-        ['bytes32', 'uint64', 'uint256', 'uint16', 'uint16', 'bytes32', 'bytes32'],
-        [portfolio_id, as_of, risk_score, correlation_bps, spread_bps, model_id_hash, features_hash]
+    # Exact field order and types from RiskSignalLib.Payload, written as seven
+    # static 32-byte ABI words (same bytes and range checks as eth_abi.encode)
+    encoded = _encode_fixed(
+        portfolio_id, as_of, risk_score, correlation_bps, spread_bps, model_id_hash, features_hash
     )
-    return keccak(encoded)
+    return _keccak256(encoded)
 
 def digest(portfolio_id: bytes, as_of: int, risk_score: int,
            correlation_bps: int, spread_bps: int, model_id: str,
@@ -81,11 +89,31 @@ def sign_digest(digest: bytes, private_key: str) -> str:
     Returns:
         0x-prefixed signature string
     """
-    # Use eth_keys directly for signing (no EIP-191 prefix)
-    from eth_keys import keys
-    pk = keys.PrivateKey(bytes.fromhex(private_key[2:]))  # Remove 0x prefix
-    signature = pk.sign_msg_hash(digest)
-    return signature.to_hex()
+    return '0x' + _sign_raw(digest, private_key).hex()
+
+def _sign_raw(digest: bytes, private_key: str) -> bytes:
+    """Sign the raw digest (no EIP-191 prefix) and return the 65-byte r||s||v signature"""
+    return _raw_signer(_pk_from_hex(private_key))(digest)
+
+def sign_many(digests: List[bytes], private_key: str) -> List[str]:
+    """
+    Sign several digests with one key, resolving the key once
+    
+    Args:
+        digests: bytes32 digests from encode_payload()
+        private_key: hex string private key
+    
+    Returns:
+        0x-prefixed signature strings (same as sign_digest), in input order
+    """
+    sign = _raw_signer(_pk_from_hex(private_key))
+    return ['0x' + sign(d).hex() for d in digests]
+
+@lru_cache(maxsize=4)
+def _pk_from_hex(private_key: str) -> keys.PrivateKey:
+    """Parse a hex private key (0x optional) once per key"""
+    key_hex = private_key[2:] if private_key.startswith(('0x', '0X')) else private_key
+    return keys.PrivateKey(bytes.fromhex(key_hex))
 
 def recover(digest: bytes, signature: str) -> str:
     """
@@ -98,20 +126,19 @@ def recover(digest: bytes, signature: str) -> str:
     Returns:
         0x-prefixed address string
     """
-    # Use eth_keys directly for recovery (no EIP-191 prefix)
-    from eth_keys import keys
-    sig = keys.Signature(bytes.fromhex(signature[2:]))  # Remove 0x prefix
-    public_key = sig.recover_public_key_from_msg_hash(digest)
-    return public_key.to_checksum_address()
+    return _recover_raw(digest, bytes.fromhex(signature[2:]))  # Remove 0x prefix
 
 def load_or_create_key() -> str:
     """Load private key from environment or create deterministic one"""
-    key = os.getenv('RISK_ORACLE_PRIVATE_KEY')
+    return _key_for(os.getenv('RISK_ORACLE_PRIVATE_KEY'), os.getenv('SEED', '42'))
+
+@lru_cache(maxsize=4)
+def _key_for(key: Optional[str], seed_str: str) -> str:
+    """Resolve the oracle key once per (RISK_ORACLE_PRIVATE_KEY, SEED) value"""
     if key:
         return key
     
     # Fallback to deterministic key for testing
-    seed_str = os.getenv('SEED', '42')
     if not seed_str:
         seed_str = '42'  # Default if empty
     seed = int(seed_str)
@@ -119,7 +146,7 @@ def load_or_create_key() -> str:
     deterministic_key = f"0x{seed:064x}"
     return deterministic_key
 
+@lru_cache(maxsize=8)
 def public_address(private_key: str) -> str:
-    """Get public address from private key"""
-    account = Account.from_key(private_key)
-    return account.address
+    """Get public address from private key (memoized per key)"""
+    return _pk_from_hex(private_key).public_key.to_checksum_address()
@@ -6,6 +6,7 @@ import json
 import pytest
 from fastapi.testclient import TestClient
 from services.pricing.app import app
+from services.pricing.baseline_model import reload_config
 
 client = TestClient(app)
 
@@ -14,6 +15,7 @@ def test_score_api_determinism():
     # Set environment for deterministic testing
     os.environ['MODEL_JITTER_BPS_OVERRIDE'] = '0'
     os.environ['SEED'] = ''
+    reload_config()
     
     # Golden vector A
     request_data = {
@@ -56,6 +58,7 @@ def test_price_api_determinism():
     # Set environment for deterministic testing
     os.environ['MODEL_JITTER_BPS_OVERRIDE'] = '0'
     os.environ['SEED'] = ''
+    reload_config()
     
     # Golden vector A
     request_data = {
@@ -106,6 +109,7 @@ def test_api_field_types():
     """Test that API returns correct field types"""
     os.environ['MODEL_JITTER_BPS_OVERRIDE'] = '0'
     os.environ['SEED'] = ''
+    reload_config()
     
     request_data = {
         "obligorId": "TEST-LLC",
@@ -161,6 +165,7 @@ def test_api_determinism_multiple_calls():
     """Test that multiple API calls return identical results"""
     os.environ['MODEL_JITTER_BPS_OVERRIDE'] = '0'
     os.environ['SEED'] = ''
+    reload_config()
     
     request_data = {
         "obligorId": "DETERMINISTIC-TEST",
@@ -199,3 +204,30 @@ def test_api_determinism_multiple_calls():
     assert result1["correlationBps"] == result2["correlationBps"]
     assert result1["digest"] == result2["digest"]
     assert result1["signature"] == result2["signature"]
+
+def test_price_batch_matches_single_requests():
+    """Test that /v1/price/batch returns exactly what /v1/price returns per entry"""
+    os.environ['MODEL_JITTER_BPS_OVERRIDE'] = '0'
+    os.environ['SEED'] = ''
+    reload_config()
+    
+    requests = [
+        {
+            "obligorId": f"BATCH-{i}",
+            "tenorDays": 180 + 5 * i,
+            "asOf": 1726000000 + i,
+            "notional": 1000000 * (i + 1),
+            "modelId": "baseline-v0",
+            "features": {"size": 0.1 * i, "leverage": 0.5, "volatility": 0.3, "countryRisk": 0.2}
+        }
+        for i in range(5)
+    ]
+    
+    response = client.post("/v1/price/batch", json=requests)
+    assert response.status_code == 200
+    
+    expected = [client.post("/v1/price", json=request_data).json() for request_data in requests]
+    assert response.json() == expected
+    
+    assert client.post("/v1/price/batch", json=[]).json() == []
+    assert client.post("/v1/price/batch", json=[{"obligorId": "X"}]).status_code == 422
@@ -1,5 +1,12 @@
-from services.pricing.determinism import canonical_features_hash, model_id_hash, digest_for_signing
-from eth_utils import to_bytes
+import dataclasses
+import datetime
+import enum
+import json
+import uuid
+import pytest
+from services.pricing.determinism import canonical_features_hash, canonical_features_json, model_id_hash, digest_for_signing, compute_outputs, keccak256, _encode_fixed
+from eth_abi import encode
+from eth_utils import keccak, to_bytes
 
 def test_canonical_features_hash_is_stable():
     a = {"b": 2, "a": [3, {"z":1}]}
@@ -7,6 +14,57 @@ def test_canonical_features_hash_is_stable():
     h2 = canonical_features_hash({"a":[3,{"z":1}],"b":2})
     assert h1 == h2
 
+FULL_FEATURES = {"size": 1.2, "leverage": 0.5, "volatility": 0.3, "fxExposure": 0.1, "countryRisk": 0.2,
+                 "industryStress": 0.4, "collateralQuality": 0.7, "dataQuality": 0.8, "modelShift": 0.1}
+
+@pytest.mark.parametrize("features", [
+    FULL_FEATURES,
+    {"b": 2, "a": [3, {"z": 1}]},
+    {"tiny": 1e-05, "huge": 1e+20, "nan": float("nan"), "none": None},
+    {"name": "caf\u00e9", "del": "\x7f", "big": 2**70},
+    {"inf": float("inf"), "neg": -1e16, "small": [1.5e-7, 0.0001], "e1": 1e15},
+])
+def test_canonical_features_json_matches_stdlib(features):
+    expected = json.dumps(features, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    assert canonical_features_json(features) == expected
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+
+class _Color(enum.Enum):
+    RED = "red"
+
+@pytest.mark.parametrize("value", [
+    datetime.datetime(2020, 1, 1), datetime.date(2020, 1, 1), _Point(1),
+    uuid.UUID(int=1), _Color.RED, [uuid.UUID(int=1)],
+])
+def test_canonical_features_json_rejects_non_json_types(value):
+    with pytest.raises(TypeError):
+        canonical_features_json({"size": 1.0, "value": value})
+
+@pytest.mark.parametrize("first,second", [
+    ({"x": 1}, {"x": True}),
+    ({"x": 1}, {"x": 1.0}),
+    ({"x": 0.0}, {"x": -0.0}),
+    ({"x": 1}, {"x": [1]}),
+    ({"x": {"a": 1}}, {"x": {"a": True}}),
+    ({"x": [0.0, {"z": 1}]}, {"x": [-0.0, {"z": 1}]}),
+    ({"x": {"b": 1, "a": [2]}}, {"x": {"a": [2], "b": 1}}),
+    ({"x": (1, 2)}, {"x": [1, 2]}),
+    # Full feature schema (pre-sorted key order)
+    ({**FULL_FEATURES, "modelShift": 0.0}, {**FULL_FEATURES, "modelShift": -0.0}),
+    ({**FULL_FEATURES, "size": 1}, {**FULL_FEATURES, "size": 1.0}),
+])
+def test_canonical_features_hash_cache_distinguishes_values(first, second):
+    for features in (first, second, first):
+        expected = keccak(json.dumps(features, separators=(',', ':'), sort_keys=True).encode('utf-8'))
+        assert canonical_features_hash(features) == expected
+
+@pytest.mark.parametrize("data", [b"", b"abc", b"\x00" * 224, "caf\u00e9".encode("utf-8")])
+def test_keccak256_matches_eth_utils(data):
+    assert keccak256(data) == keccak(data)
+
 def test_digest_matches_known_vector():
     pid = to_bytes(hexstr='0x' + '11'*32)
     asof = 1_700_000_000
@@ -17,3 +75,29 @@ def test_digest_matches_known_vector():
     fh  = bytes.fromhex('22'*32)
     d = digest_for_signing(pid, asof, risk, corr, spread, mid, fh)
     assert len(d) == 32
+
+PAYLOAD_TYPES = ['bytes32','uint64','uint256','uint16','uint16','bytes32','bytes32']
+
+@pytest.mark.parametrize("values", [
+    (to_bytes(hexstr='0x' + '11'*32), 1_700_000_000, 123456789, 777, 1500,
+     model_id_hash('xgb-v0-stub'), bytes.fromhex('22'*32)),
+    (bytes(32), 0, 0, 0, 0, bytes(32), bytes(32)),
+    (b'\xff'*32, 2**64 - 1, 2**256 - 1, 2**16 - 1, 2**16 - 1, b'\xff'*32, b'\x01'),
+])
+def test_encode_fixed_matches_eth_abi(values):
+    assert _encode_fixed(*values) == encode(PAYLOAD_TYPES, list(values))
+
+@pytest.mark.parametrize("index,value", [(1, 2**64), (2, -1), (3, 2**16), (4, True), (0, b'\x00'*33)])
+def test_encode_fixed_rejects_out_of_range(index, value):
+    values = [bytes(32), 0, 0, 0, 0, bytes(32), bytes(32)]
+    values[index] = value
+    with pytest.raises(ValueError):
+        _encode_fixed(*values)
+
+def test_compute_outputs_known_vector():
+    pid = to_bytes(hexstr='0x' + '11'*32)
+    fh = bytes.fromhex('22'*32)
+    x = int.from_bytes(keccak(pid + (1_700_000_000).to_bytes(8, 'big') + fh), 'big')
+    assert compute_outputs(pid, 1_700_000_000, fh) == dict(
+        riskScore=x % (10**24), correlationBps=x % 10001, spreadBps=100 + x % 1901
+    )
@@ -2,11 +2,15 @@
 Test deterministic model math with golden vectors
 """
 import os
+import math
+import random
+import re
 import pytest
 from services.pricing.baseline_model import (
-    score_risk, price_cds, get_risk_score_bps, jitter_bps,
-    round_half_up, clamp
+    score_risk, score_risk_batch, price_cds, get_risk_score_bps, jitter_bps,
+    round_half_up, clamp, reload_config
 )
+from eth_utils import keccak
 
 def test_round_half_up():
     """Test round_half_up function (not bankers' rounding)"""
@@ -28,25 +32,98 @@ def test_jitter_bps_override():
     """Test jitter override functionality"""
     # Test override
     os.environ['MODEL_JITTER_BPS_OVERRIDE'] = '3'
+    reload_config()
     assert jitter_bps("test", "obligor", 365, 1726000000) == 3
     
     # Test empty seed
     del os.environ['MODEL_JITTER_BPS_OVERRIDE']
     os.environ['SEED'] = ''
+    reload_config()
     assert jitter_bps("", "obligor", 365, 1726000000) == 0
     
     # Test deterministic jitter
     os.environ['SEED'] = '42'
+    reload_config()
     jitter1 = jitter_bps("42", "obligor", 365, 1726000000)
     jitter2 = jitter_bps("42", "obligor", 365, 1726000000)
     assert jitter1 == jitter2
     assert -5 <= jitter1 <= 5
 
+def test_config_read_on_reload_only():
+    """Test env changes apply only after reload_config"""
+    os.environ['MODEL_JITTER_BPS_OVERRIDE'] = '2'
+    reload_config()
+    os.environ['MODEL_JITTER_BPS_OVERRIDE'] = '4'
+    assert jitter_bps("42", "obligor", 365, 1726000000) == 2
+    reload_config()
+    assert jitter_bps("42", "obligor", 365, 1726000000) == 4
+    del os.environ['MODEL_JITTER_BPS_OVERRIDE']
+    reload_config()
+
+def test_jitter_bps_cache_tracks_seed():
+    """Test cached jitter matches the keccak formula for each seed"""
+    os.environ.pop('MODEL_JITTER_BPS_OVERRIDE', None)
+    reload_config()
+    for seed in ("42", "43", "42"):
+        digest = keccak(text=f"obligor:365:1726000000:{seed}")
+        expected = int.from_bytes(digest[-2:], 'big') % 11 - 5
+        assert jitter_bps(seed, "obligor", 365, 1726000000) == expected
+
+def test_score_risk_batch_matches_scalar():
+    """Test batched scoring is bit-identical to score_risk, including missing features"""
+    rng = random.Random(7)
+    names = ['size', 'leverage', 'volatility', 'fxExposure', 'countryRisk',
+             'industryStress', 'collateralQuality', 'dataQuality', 'modelShift']
+    batch = [{name: rng.uniform(-2.0, 40.0) for name in names if rng.random() < 0.9}
+             for _ in range(500)]
+    batch.append({'size': 1, 'leverage': 0.5})
+    batch.append({})
+    
+    expected = [score_risk(f, "obligor", 365, 1726000000) for f in batch]
+    assert score_risk_batch(batch) == expected
+    assert score_risk_batch([]) == []
+
+@pytest.mark.filterwarnings("error")
+def test_score_risk_batch_rejects_non_finite_like_scalar():
+    """Test NaN/inf features raise the same errors in batch as in score_risk"""
+    nan, inf = float('nan'), float('inf')
+    for bad in ({'leverage': nan}, {'industryStress': inf}, {'size': -inf}, {'size': inf, 'leverage': -inf}):
+        with pytest.raises((ValueError, OverflowError)) as expected:
+            score_risk(bad, "obligor", 365, 1726000000)
+        with pytest.raises(expected.type, match=re.escape(str(expected.value))):
+            score_risk_batch([{'size': 1.0}, bad])
+    
+    # Confidence inputs are only clamped, so they never raise
+    for bad in ({'dataQuality': nan}, {'modelShift': inf}, {'dataQuality': -inf}):
+        assert score_risk_batch([bad]) == [score_risk(bad, "obligor", 365, 1726000000)]
+
+def test_score_risk_batch_non_numeric_features_like_scalar():
+    """Test batch scoring rejects non-numeric features exactly like score_risk"""
+    for bad in ({'size': '0.5'}, {'leverage': None}, {'volatility': [1]}, {'countryRisk': {'a': 1}}):
+        with pytest.raises(TypeError) as expected:
+            score_risk(bad, "obligor", 365, 1726000000)
+        with pytest.raises(TypeError, match=re.escape(str(expected.value))):
+            score_risk_batch([{'size': 1.0}, bad, {'leverage': float('nan')}])
+    
+    # Errors surface in row order, as a loop over score_risk would raise them
+    with pytest.raises(ValueError):
+        score_risk_batch([{'leverage': float('nan')}, {'size': '0.5'}])
+    
+    batch = [{'size': True, 'leverage': 1}, {'dataQuality': False}, {'size': 0.5}]
+    assert score_risk_batch(batch) == [score_risk(f, "obligor", 365, 1726000000) for f in batch]
+
+def test_price_cds_rp_table_matches_sqrt():
+    """Test the tabulated risk premium equals the direct formula"""
+    for pd_bps in (0, 1, 5, 119, 2999, 3000, 3001, 12.5):
+        result = price_cds("obligor", 365, {}, pd_bps, 4500, 1726000000)
+        assert result['rpBps'] == 0.6 * math.sqrt(max(pd_bps, 1))
+
 def test_golden_vector_a():
     """Test golden vector A with exact expected values"""
     # Set environment for deterministic testing
     os.environ['MODEL_JITTER_BPS_OVERRIDE'] = '0'
     os.environ['SEED'] = ''
+    reload_config()
     
     obligor_id = "ACME-LLC"
     tenor_days = 365
@@ -90,6 +167,7 @@ def test_boundary_clamps():
     """Test boundary clamping behavior"""
     os.environ['MODEL_JITTER_BPS_OVERRIDE'] = '0'
     os.environ['SEED'] = ''
+    reload_config()
     
     # Test minimum clamps
     tiny_features = {
@@ -137,6 +215,7 @@ def test_boundary_clamps():
 def test_determinism():
     """Test that outputs are deterministic with fixed seed"""
     os.environ['SEED'] = '42'
+    reload_config()
     # Don't set override so jitter is deterministic
     
     features = {
@@ -167,6 +246,7 @@ def test_missing_features_default_to_zero():
     """Test that missing features default to 0.0"""
     os.environ['MODEL_JITTER_BPS_OVERRIDE'] = '0'
     os.environ['SEED'] = ''
+    reload_config()
     
     # Test with empty features dict
     empty_features = {}
@@ -1,8 +1,25 @@
-from services.pricing.crypto import load_or_create_key, sign_digest
+from services.pricing.crypto import load_or_create_key, public_address, sign_digest
 from eth_utils import keccak
+from eth_keys import keys
 
 def test_sign_and_length():
     pk = load_or_create_key()
     d = keccak(b'abc')
     sig = sign_digest(pk, d)
     assert sig.startswith('0x') and len(bytes.fromhex(sig[2:])) == 65
+
+def test_ephemeral_key_stable_per_process(monkeypatch):
+    monkeypatch.delenv('ORACLE_PRIVATE_KEY', raising=False)
+    assert load_or_create_key() is load_or_create_key()
+    monkeypatch.setenv('ORACLE_PRIVATE_KEY', '0x' + '01' * 32)
+    pk = load_or_create_key()
+    assert pk.to_bytes() == bytes.fromhex('01' * 32)
+    assert public_address(pk) == pk.public_key.to_checksum_address()
+
+def test_signature_recovers_signer(monkeypatch):
+    monkeypatch.setenv('ORACLE_PRIVATE_KEY', '0x' + '01' * 32)
+    pk = load_or_create_key()
+    d = keccak(b'abc')
+    sig = keys.Signature(bytes.fromhex(sign_digest(pk, d)[2:]))
+    assert sig.v in (0, 1)
+    assert sig.recover_public_key_from_msg_hash(d) == pk.public_key
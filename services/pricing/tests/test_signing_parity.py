@@ -3,8 +3,11 @@ Test signing parity with Solidity RiskSignalLib
 """
 import os
 import pytest
+import json
+from eth_abi import encode
+from eth_utils import keccak
 from services.pricing.signing import (
-    digest, sign_digest, recover, load_or_create_key, public_address,
+    digest, sign_digest, sign_many, recover, load_or_create_key, public_address,
     canonical_features_hash, model_id_hash
 )
 
@@ -62,6 +65,23 @@ def test_signing_parity():
     # Verify digest format
     assert len(digest_bytes) == 32  # 32 bytes for keccak256
 
+def test_digest_matches_reference_encoding():
+    """Test the digest equals keccak(eth_abi.encode(...)) of the RiskSignalLib payload"""
+    portfolio_id = bytes.fromhex('11' * 32)
+    features = {"size": 0.5, "leverage": 0.3, "dataQuality": 0.8}
+    features_hash = keccak(json.dumps(features, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+    
+    for as_of, risk_score, correlation_bps, spread_bps in [
+        (1700000000, 123456789, 777, 1500),
+        (0, 0, 0, 0),
+        (2**64 - 1, 2**256 - 1, 2**16 - 1, 2**16 - 1),
+    ]:
+        expected = keccak(encode(
+            ['bytes32', 'uint64', 'uint256', 'uint16', 'uint16', 'bytes32', 'bytes32'],
+            [portfolio_id, as_of, risk_score, correlation_bps, spread_bps, keccak(text="xgb-v0-stub"), features_hash]
+        ))
+        assert digest(portfolio_id, as_of, risk_score, correlation_bps, spread_bps, "xgb-v0-stub", features) == expected
+
 def test_canonical_features_hash():
     """Test that features hash is deterministic and canonical"""
     features1 = {"a": 1, "b": 2}
@@ -97,3 +117,43 @@ def test_deterministic_key_generation():
     assert address.startswith('0x')
     print(f"Deterministic key: {key1}")
     print(f"Deterministic address: {address}")
+
+def test_public_address_matches_eth_account():
+    """Test the eth_keys-derived address equals eth_account's"""
+    from eth_account import Account
+    for key in ('0x' + '%064x' % 42, '%064x' % 7, '0x' + 'ab' * 32):
+        assert public_address(key) == Account.from_key(key).address
+
+def test_sign_many_matches_sign_digest():
+    """Test bulk signing returns sign_digest's signature for each digest"""
+    private_key = '0x' + '%064x' % 42
+    digests = [keccak(text=f"digest-{i}") for i in range(4)]
+    
+    assert sign_many(digests, private_key) == [sign_digest(d, private_key) for d in digests]
+    assert sign_many([], private_key) == []
+
+def test_raw_sign_and_recover():
+    """Test the raw-bytes signing core round-trips and matches the hex API"""
+    from services.pricing.signing import _sign_raw, _recover_raw
+    private_key = '0x' + '%064x' % 42
+    digest_bytes = keccak(text="raw")
+    
+    sig_bytes = _sign_raw(digest_bytes, private_key)
+    
+    assert len(sig_bytes) == 65 and sig_bytes[64] in (0, 1)
+    assert '0x' + sig_bytes.hex() == sign_digest(digest_bytes, private_key)
+    assert _recover_raw(digest_bytes, sig_bytes) == public_address(private_key)
+
+def test_coincurve_matches_eth_keys():
+    """Test the libsecp256k1 fast path signs and recovers byte-identically to eth_keys"""
+    pytest.importorskip("coincurve")
+    from eth_keys import keys
+    from services.pricing.crypto import _raw_signer, _recover_raw
+    for secret in (42, 7, int('ab' * 32, 16)):
+        pk = keys.PrivateKey(secret.to_bytes(32, 'big'))
+        sign = _raw_signer(pk)
+        for i in range(16):
+            digest_bytes = keccak(text=f"parity-{secret}-{i}")
+            sig_bytes = sign(digest_bytes)
+            assert sig_bytes == pk.sign_msg_hash(digest_bytes).to_bytes()
+            assert _recover_raw(digest_bytes, sig_bytes) == pk.public_key.to_checksum_address()